@@ -63,6 +63,7 @@ export async function adminRoutes(app: FastifyInstance) {
   });
   app.get("/knowledge/articles", async (req, reply) => proxyToOrchestration("knowledge/articles", req, reply));
   app.post("/knowledge/articles", async (req, reply) => proxyToOrchestration("knowledge/articles", req, reply));
+  app.post("/knowledge/articles/bulk", async (req, reply) => proxyToOrchestration("knowledge/articles/bulk", req, reply));
   app.get("/appointments", async (req, reply) => proxyToOrchestration("appointments", req, reply));
   app.post("/appointments", async (req, reply) => proxyToOrchestration("appointments", req, reply));
   app.patch("/appointments/:id", async (req, reply) => {
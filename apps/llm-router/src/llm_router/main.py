@@ -1,9 +1,9 @@
 import asyncio
-import json
 import os
 import time
 from contextlib import asynccontextmanager
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from loguru import logger
@@ -100,8 +100,14 @@ async def lifespan(app: FastAPI):
     app.state.intent_embeddings = {}
     # Shared HTTP client for RAG embed and telemetry (connection reuse, lower latency)
     app.state.http_client = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=8))
+    # One pool for all provider SDKs; HTTP/2 multiplexes concurrent completions over a single TLS connection
+    app.state.llm_http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=120.0,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    )
     try:
-        app.state.llm_router = LLMRouter()
+        app.state.llm_router = LLMRouter(http_client=app.state.llm_http_client)
         if not app.state.llm_router.providers:
             logger.warning("No LLM providers configured. Set OPENAI_API_KEY, ANTHROPIC_API_KEY, GOOGLE_AI_API_KEY, or LM_STUDIO_BASE_URL.")
         else:
@@ -121,9 +127,14 @@ async def lifespan(app: FastAPI):
         app.state.llm_router = LLMRouter.__new__(LLMRouter)
         app.state.llm_router._clients = {}
         app.state.llm_router._fallback_order = []
+        app.state.llm_router._batch_queue = None
+        app.state.llm_router._batcher_task = None
+        app.state.llm_router._batch_tasks = set()
         app.state.intent_embeddings = {}
     yield
+    await app.state.llm_router.aclose()
     await app.state.http_client.aclose()
+    await app.state.llm_http_client.aclose()
     logger.info("LLM Router shutting down")
 
 
@@ -238,11 +249,11 @@ async def generate_stream(request: GenerateRequest, req: Request):
     async def ndjson_stream():
         try:
             async for chunk in req.app.state.llm_router.generate_stream(llm_request, provider=request.provider):
-                yield json.dumps({"type": "delta", "content": chunk}) + "\n"
-            yield json.dumps({"type": "done"}) + "\n"
+                yield orjson.dumps({"type": "delta", "content": chunk}) + b"\n"
+            yield orjson.dumps({"type": "done"}) + b"\n"
         except Exception as e:
             logger.warning("generate_stream failed: {}", e)
-            yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+            yield orjson.dumps({"type": "error", "message": str(e)}) + b"\n"
 
     return StreamingResponse(
         ndjson_stream(),
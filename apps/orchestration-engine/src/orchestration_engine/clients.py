@@ -1,8 +1,8 @@
 """HTTP clients for calling downstream AURIXA services."""
 
 import asyncio
-import json
 import httpx
+import orjson
 from collections.abc import AsyncIterator
 from loguru import logger
 
@@ -207,12 +207,12 @@ async def call_llm_generate_stream(
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = orjson.loads(line)
                     if obj.get("type") == "delta" and "content" in obj:
                         yield obj["content"]
                     elif obj.get("type") == "error":
                         raise RuntimeError(obj.get("message", "Stream error"))
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
     except httpx.HTTPError as e:
         logger.error("HTTP error calling LLM Router stream: {}", e)
@@ -1,18 +1,21 @@
 import asyncio
 import datetime
 import hashlib
-import json
 import os
 import time
+import orjson
 from contextlib import asynccontextmanager
+from typing import Literal
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
+from sqlalchemy import select, func, cast
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import load_only
 from pydantic import BaseModel
 
-from aurixa_db import get_db_session, engine, Base, models as db_models
+from aurixa_db import get_db_session, get_read_db_session, bulk_insert, engine, Base, models as db_models
 from . import clients
 
 # Response cache for repeated prompts (cost reduction). Capped size to avoid unbounded memory growth.
@@ -121,7 +124,7 @@ async def execute_step(
         step_name=name,
         status="in_progress",
         input=input_data,
-        start_time=time.time(),
+        start_time=datetime.datetime.now(datetime.timezone.utc),
     )
     db.add(step)
     await db.commit()
@@ -139,11 +142,11 @@ async def execute_step(
         step.error_message = str(e)
         raise
     finally:
-        step.end_time = time.time()
+        step.end_time = datetime.datetime.now(datetime.timezone.utc)
         db.add(step)
         await db.commit()
-        duration_ms = (step.end_time - step.start_time) * 1000 if step.end_time and step.start_time else None
-        _emit_step_telemetry(name, duration_ms, conversation.session_id)
+        # duration_ms is computed by the database and fetched back on flush (eager_defaults).
+        _emit_step_telemetry(name, step.duration_ms, conversation.session_id)
 
 
 @app.get("/health", summary="Health check endpoint")
@@ -154,6 +157,29 @@ async def health():
 
 # --- Admin API (tenants, audit, patients) ---
 
+# Column projections for list endpoints: load only what the response serialises
+_PATIENT_LIST_COLS = load_only(
+    db_models.Patient.full_name, db_models.Patient.email, db_models.Patient.phone_number
+)
+_CONVERSATION_LIST_COLS = load_only(
+    db_models.Conversation.session_id, db_models.Conversation.created_at
+)
+_STEP_SUMMARY_COLS = load_only(
+    db_models.PipelineStep.step_name, db_models.PipelineStep.input, db_models.PipelineStep.output
+)
+_APPOINTMENT_LIST_COLS = load_only(
+    db_models.Appointment.start_time,
+    db_models.Appointment.end_time,
+    db_models.Appointment.provider_name,
+    db_models.Appointment.status,
+    db_models.Appointment.patient_id,
+    db_models.Appointment.tenant_id,
+)
+_STAFF_LIST_COLS = load_only(
+    db_models.Staff.full_name, db_models.Staff.email, db_models.Staff.role, db_models.Staff.tenant_id
+)
+_TENANT_SUMMARY_COLS = load_only(db_models.Tenant.plan, db_models.Tenant.status)
+
 class TenantOut(BaseModel):
     id: str
     name: str
@@ -183,10 +209,14 @@ async def list_tenants(db: AsyncSession = Depends(get_db_session)):
     ]
 
 
+TenantPlan = Literal["starter", "professional", "enterprise"]
+TenantStatus = Literal["active", "suspended", "pending"]
+
+
 class TenantCreateIn(BaseModel):
     name: str
-    plan: str = "starter"
-    status: str = "active"
+    plan: TenantPlan = "starter"
+    status: TenantStatus = "active"
 
 
 @app.post("/api/v1/tenants", summary="Create a tenant")
@@ -239,8 +269,8 @@ async def get_tenant(tenant_id: str, db: AsyncSession = Depends(get_db_session))
 
 class TenantUpdateIn(BaseModel):
     name: str | None = None
-    plan: str | None = None
-    status: str | None = None
+    plan: TenantPlan | None = None
+    status: TenantStatus | None = None
 
 
 @app.patch("/api/v1/tenants/{tenant_id}", summary="Update a tenant")
@@ -310,7 +340,7 @@ async def list_patients(
     db: AsyncSession = Depends(get_db_session),
     tenant_id: int | None = None,
 ):
-    q = select(db_models.Patient)
+    q = select(db_models.Patient).options(_PATIENT_LIST_COLS)
     if tenant_id:
         q = q.where(db_models.Patient.tenant_id == tenant_id)
     result = await db.execute(q.order_by(db_models.Patient.id))
@@ -383,9 +413,11 @@ async def list_patient_conversations(
     limit: int = 20,
 ):
     """Return recent conversations where meta_data contains patient_id (voice calls, portal chat)."""
+    # Containment (@>) so the jsonb_path_ops GIN index on meta_data serves the filter.
     stmt = (
         select(db_models.Conversation)
-        .where(text("(meta_data->>'patient_id')::int = :pid").bindparams(pid=patient_id))
+        .options(_CONVERSATION_LIST_COLS)
+        .where(db_models.Conversation.meta_data.op("@>")(cast({"patient_id": patient_id}, JSONB)))
         .order_by(db_models.Conversation.created_at.desc())
         .limit(limit)
     )
@@ -395,6 +427,7 @@ async def list_patient_conversations(
     for c in convos:
         steps = await db.execute(
             select(db_models.PipelineStep)
+            .options(_STEP_SUMMARY_COLS)
             .where(db_models.PipelineStep.conversation_id == c.id)
             .order_by(db_models.PipelineStep.start_time.asc())
         )
@@ -424,7 +457,11 @@ async def list_appointments(
     limit: int = 100,
 ):
     """List appointments for hospital staff. Optional filters: tenant_id, date_from (YYYY-MM-DD), date_to."""
-    q = select(db_models.Appointment).order_by(db_models.Appointment.start_time.desc())
+    q = (
+        select(db_models.Appointment)
+        .options(_APPOINTMENT_LIST_COLS)
+        .order_by(db_models.Appointment.start_time.desc())
+    )
     if tenant_id:
         q = q.where(db_models.Appointment.tenant_id == tenant_id)
     if date_from:
@@ -460,10 +497,10 @@ async def list_appointments(
 async def list_staff(
     db: AsyncSession = Depends(get_db_session),
     tenant_id: int | None = None,
-    role: str | None = None,
+    role: Literal["reception", "nurse", "doctor", "scheduler", "admin"] | None = None,
 ):
     """List staff for hospital portal. Optional filters: tenant_id, role."""
-    q = select(db_models.Staff).where(db_models.Staff.is_active == True)
+    q = select(db_models.Staff).options(_STAFF_LIST_COLS).where(db_models.Staff.is_active == True)
     if tenant_id:
         q = q.where(db_models.Staff.tenant_id == tenant_id)
     if role:
@@ -545,7 +582,7 @@ async def create_appointment(data: CreateApptIn, db: AsyncSession = Depends(get_
 
 
 class AppointmentUpdateIn(BaseModel):
-    status: str  # cancelled, completed, confirmed
+    status: Literal["confirmed", "cancelled", "completed"]
 
 
 @app.patch("/api/v1/appointments/{appointment_id}", summary="Update appointment status")
@@ -580,6 +617,7 @@ async def list_patient_appointments(
 ):
     result = await db.execute(
         select(db_models.Appointment)
+        .options(_APPOINTMENT_LIST_COLS)
         .where(db_models.Appointment.patient_id == patient_id)
         .order_by(db_models.Appointment.start_time.desc())
     )
@@ -597,7 +635,7 @@ async def list_patient_appointments(
 
 
 @app.get("/api/v1/analytics/summary", summary="DB-backed analytics summary")
-async def get_analytics_summary(db: AsyncSession = Depends(get_db_session)):
+async def get_analytics_summary(db: AsyncSession = Depends(get_read_db_session)):
     """Aggregate counts from DB for dashboards."""
     conv = await db.execute(select(func.count(db_models.Conversation.id)))
     tenants = await db.execute(select(func.count(db_models.Tenant.id)))
@@ -616,10 +654,10 @@ async def get_analytics_summary(db: AsyncSession = Depends(get_db_session)):
 
 
 @app.get("/api/v1/config/summary", summary="Platform configuration summary")
-async def get_config_summary(db: AsyncSession = Depends(get_db_session)):
+async def get_config_summary(db: AsyncSession = Depends(get_read_db_session)):
     """Platform config for Configuration page."""
     logger.debug("Fetching config summary")
-    result = await db.execute(select(db_models.Tenant))
+    result = await db.execute(select(db_models.Tenant).options(_TENANT_SUMMARY_COLS))
     tenants = result.scalars().all()
     tenants_by_plan = {"starter": 0, "professional": 0, "enterprise": 0}
     tenants_by_status = {"active": 0, "suspended": 0, "pending": 0}
@@ -678,11 +716,17 @@ async def update_config_key(key: str, data: ConfigUpdateIn, db: AsyncSession = D
 async def list_knowledge_articles(
     db: AsyncSession = Depends(get_db_session),
     tenant_id: int | None = None,
+    q: str | None = None,
 ):
-    q = select(db_models.KnowledgeBaseArticle)
+    """List articles. Optional filters: tenant_id, q (full-text search over title and content)."""
+    stmt = select(db_models.KnowledgeBaseArticle)
     if tenant_id:
-        q = q.where(db_models.KnowledgeBaseArticle.tenant_id == tenant_id)
-    result = await db.execute(q.order_by(db_models.KnowledgeBaseArticle.id))
+        stmt = stmt.where(db_models.KnowledgeBaseArticle.tenant_id == tenant_id)
+    if q:
+        stmt = stmt.where(
+            db_models.KnowledgeBaseArticle.search_vector.op("@@")(func.plainto_tsquery("english", q))
+        )
+    result = await db.execute(stmt.order_by(db_models.KnowledgeBaseArticle.id))
     articles = result.scalars().all()
     return [
         {
@@ -726,6 +770,30 @@ async def create_knowledge_article(data: KnowledgeArticleCreateIn, db: AsyncSess
     return {"id": article.id, "title": article.title, "content": article.content, "tenantId": article.tenant_id}
 
 
+@app.post("/api/v1/knowledge/articles/bulk", summary="Import many knowledge base articles")
+async def import_knowledge_articles(
+    data: list[KnowledgeArticleCreateIn], db: AsyncSession = Depends(get_db_session)
+):
+    """Bulk import for RAG ingestion: one tenant check and one batched INSERT for all articles."""
+    if not data:
+        return {"imported": 0}
+    tenant_ids = {a.tenant_id for a in data}
+    result = await db.execute(select(db_models.Tenant.id).where(db_models.Tenant.id.in_(tenant_ids)))
+    missing = tenant_ids - set(result.scalars().all())
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Tenant ids not found: {sorted(missing)}")
+    await bulk_insert(db, db_models.KnowledgeBaseArticle, [a.model_dump() for a in data])
+    db.add(db_models.AuditLog(
+        service="Orchestration Engine",
+        action="Knowledge Articles Imported",
+        user="admin",
+        details=f"Imported {len(data)} articles for tenants {sorted(tenant_ids)}",
+        severity="info",
+    ))
+    await db.commit()
+    return {"imported": len(data)}
+
+
 @app.post("/api/v1/pipelines", response_model=ConversationState, summary="Run an orchestration pipeline")
 async def run_pipeline(
     request: PipelineRequest, db: AsyncSession = Depends(get_db_session)
@@ -843,8 +911,8 @@ async def run_pipeline(
             input=step.input,
             output=step.output,
             error_message=step.error_message,
-            start_time=step.start_time,
-            end_time=step.end_time,
+            start_time=step.start_time.timestamp() if step.start_time else None,
+            end_time=step.end_time.timestamp() if step.end_time else None,
         )
         for step in conversation.pipeline_steps
     ]
@@ -860,7 +928,7 @@ async def run_pipeline(
 
 
 def _ndjson_line(obj: dict) -> bytes:
-    return (json.dumps(obj) + "\n").encode("utf-8")
+    return orjson.dumps(obj) + b"\n"
 
 
 @app.post("/api/v1/pipelines/stream", summary="Run pipeline with NDJSON stream (status + text_delta + done)")
@@ -114,28 +114,24 @@ async def _run_pipeline_stream_ws(
             if response.status_code != 200:
                 await websocket.send_json({"type": "error", "message": f"Pipeline returned {response.status_code}"})
                 return None
-            buffer = ""
-            async for chunk in response.aiter_text():
-                buffer += chunk
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                        event = obj.get("event")
-                        if event == "status":
-                            await websocket.send_json({"type": "status", "status": "processing", "message": obj.get("message", "")})
-                        elif event == "text_delta":
-                            await websocket.send_json({"type": "text_delta", "content": obj.get("delta", "")})
-                        elif event == "done":
-                            final_response = obj.get("final_response", "")
-                        elif event == "error":
-                            await websocket.send_json({"type": "error", "message": obj.get("message", "Stream error")})
-                            return None
-                    except json.JSONDecodeError:
-                        continue
+            async for line in response.aiter_lines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                    event = obj.get("event")
+                    if event == "status":
+                        await websocket.send_json({"type": "status", "status": "processing", "message": obj.get("message", "")})
+                    elif event == "text_delta":
+                        await websocket.send_json({"type": "text_delta", "content": obj.get("delta", "")})
+                    elif event == "done":
+                        final_response = obj.get("final_response", "")
+                    elif event == "error":
+                        await websocket.send_json({"type": "error", "message": obj.get("message", "Stream error")})
+                        return None
+                except json.JSONDecodeError:
+                    continue
         return final_response or "No response generated."
     except httpx.ConnectError:
         logger.warning("Orchestration unavailable")
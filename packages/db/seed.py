@@ -1,251 +1,473 @@
 """Script to seed the database with mock data."""
 
+import argparse
 import asyncio
+import os
 from loguru import logger
 import datetime
 
-from aurixa_db.database import AsyncSessionLocal, engine
+from sqlalchemy import Enum, insert, text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from aurixa_db.database import DATABASE_URL, INSERTMANYVALUES_PAGE_SIZE
 from aurixa_db.models import (
     Tenant, User, Patient, Appointment, KnowledgeBaseArticle,
     AuditLog, PlatformConfig, Conversation, Base,
     PatientInsurance, Prescription, AvailabilitySlot, Staff,
 )
 
+# Reused offsets so appointment/slot construction does not allocate a timedelta per field.
+ONE_HOUR = datetime.timedelta(hours=1)
+DAY_OFFSETS = {k: datetime.timedelta(days=k) for k in (1, 2, 3, 5)}
+SLOT_DAYS = 7
+
+# Seed profiles, smallest first; each one includes everything seeded by the previous.
+#   minimal  - tenants, patients, users, platform config (enough to boot the consoles)
+#   standard - + staff, appointments, insurance, prescriptions, knowledge base
+#   full     - + conversations, audit logs, availability slots
+PROFILES = ("minimal", "standard", "full")
+
+# ---------------------------------------------------------------------------
+# Static payloads. Rows that reference other rows use ``tenant`` / ``patient``
+# as an index into TENANT_ROWS / PATIENT_ROWS; _resolve() swaps in the real ids.
+# ---------------------------------------------------------------------------
+
+# AURIXA healthcare tenants
+TENANT_ROWS: tuple[dict, ...] = (
+    {"name": "General Hospital", "domain": "generalhospital.com", "plan": "enterprise", "status": "active", "api_key_count": 5},
+    {"name": "Downtown Clinic", "domain": "downtownclinic.org", "plan": "professional", "status": "active", "api_key_count": 3},
+    {"name": "Sunrise Medical Center", "domain": "sunrisemedical.com", "plan": "enterprise", "status": "active", "api_key_count": 8},
+    {"name": "Family Care Associates", "domain": "familycare.net", "plan": "starter", "status": "active", "api_key_count": 1},
+    {"name": "Metro Health Systems", "domain": "metrohealth.io", "plan": "professional", "status": "suspended", "api_key_count": 2},
+    {"name": "Valley View Hospital", "domain": "valleyview.org", "plan": "enterprise", "status": "active", "api_key_count": 6},
+    {"name": "Riverside Clinic", "domain": "riversideclinic.com", "plan": "starter", "status": "pending", "api_key_count": 0},
+)
+
+# Every row carries the same keys so the RETURNING batch is a single INSERT.
+PATIENT_ROWS: tuple[dict, ...] = (
+    {"full_name": "John Doe", "email": "john.doe@email.com", "phone_number": None, "tenant": 0},
+    {"full_name": "Jane Smith", "email": None, "phone_number": "123-456-7890", "tenant": 1},
+    {"full_name": "Alice Johnson", "email": "alice.j@email.com", "phone_number": "555-0101", "tenant": 0},
+    {"full_name": "Bob Williams", "email": "bob.w@email.com", "phone_number": None, "tenant": 0},
+    {"full_name": "Carol Davis", "email": None, "phone_number": "555-0102", "tenant": 1},
+)
+
+USER_ROWS: tuple[dict, ...] = (
+    {"email": "admin@generalhospital.com", "hashed_password": "fake-password", "full_name": "Admin GH", "tenant": 0},
+    {"email": "staff@downtownclinic.org", "hashed_password": "fake-password", "full_name": "Staff DC", "tenant": 1},
+)
+
+# Hospital workers per tenant
+STAFF_ROWS: tuple[dict, ...] = (
+    {"full_name": "Sarah Chen", "email": "sarah.chen@generalhospital.com", "role": "reception", "tenant": 0},
+    {"full_name": "Mike Johnson", "email": "mike.j@generalhospital.com", "role": "nurse", "tenant": 0},
+    {"full_name": "Dr. Adams", "email": "adam.m@generalhospital.com", "role": "doctor", "tenant": 0},
+    {"full_name": "Dr. Bell", "email": "bell.d@generalhospital.com", "role": "doctor", "tenant": 0},
+    {"full_name": "Dr. Chen", "email": "chen.l@generalhospital.com", "role": "doctor", "tenant": 0},
+    {"full_name": "Emma Wilson", "email": "emma.w@generalhospital.com", "role": "scheduler", "tenant": 0},
+    {"full_name": "Admin GH", "email": "admin@generalhospital.com", "role": "admin", "tenant": 0},
+    {"full_name": "Reception DC", "email": "reception@downtownclinic.org", "role": "reception", "tenant": 1},
+    {"full_name": "Dr. Bell", "email": "bell.d@downtownclinic.org", "role": "doctor", "tenant": 1},
+)
+
+# Conversations (for analytics)
+CONVERSATION_ROWS: tuple[dict, ...] = (
+    {"session_id": "conv-001", "meta_data": {"tenant_id": 1, "user_id": "u1"}},
+    {"session_id": "conv-002", "meta_data": {"tenant_id": 1, "user_id": "u2"}},
+    {"session_id": "conv-003", "meta_data": {"tenant_id": 2, "user_id": "u1"}},
+)
+
+# ``day`` is a key into DAY_OFFSETS; each appointment lasts ONE_HOUR.
+APPOINTMENT_ROWS: tuple[dict, ...] = (
+    {"day": 1, "provider_name": "Dr. Adams", "reason": "Annual checkup", "status": "confirmed", "tenant": 0, "patient": 0},
+    {"day": 2, "provider_name": "Dr. Bell", "reason": "Follow-up", "status": "confirmed", "tenant": 1, "patient": 1},
+    {"day": 3, "provider_name": "Dr. Chen", "reason": "Lab review", "status": "completed", "tenant": 0, "patient": 0},
+    {"day": 5, "provider_name": "Dr. Adams", "reason": "General visit", "status": "confirmed", "tenant": 0, "patient": 2},
+)
+
+INSURANCE_ROWS: tuple[dict, ...] = (
+    {"patient": 0, "plan_name": "In-Network PPO", "payer": "Aetna", "copay": "$25", "status": "active"},
+    {"patient": 1, "plan_name": "UnitedHealthcare", "payer": "UHC", "member_id": "UHC-12345", "copay": "$30", "status": "active"},
+    {"patient": 2, "plan_name": "Blue Cross PPO", "payer": "BCBS", "copay": "$20", "status": "active"},
+    {"patient": 3, "plan_name": "Medicare", "payer": "CMS", "copay": "$0", "status": "active"},
+)
+
+PRESCRIPTION_ROWS: tuple[dict, ...] = (
+    {"patient": 0, "medication_name": "Lisinopril 10mg", "status": "active"},
+    {"patient": 0, "medication_name": "Metformin 500mg", "status": "active"},
+    {"patient": 2, "medication_name": "Amlodipine 5mg", "status": "active"},
+)
+
+# Availability slots for the first tenant, next SLOT_DAYS days
+PROVIDERS = ("Dr. Adams", "Dr. Bell", "Dr. Chen")
+SLOT_TIMES = (("09:00", "09:30"), ("10:00", "10:30"), ("14:00", "14:30"))
+
+# Patient-facing FAQ + admin
+KB_ROWS: tuple[dict, ...] = (
+    {
+        "title": "Billing Inquiries",
+        "content": "For billing questions, please call 555-123-4567 or visit our patient portal. We accept most major insurance plans.",
+        "tenant": 0,
+    },
+    {
+        "title": "Operating Hours",
+        "content": "Our clinic is open Monday to Friday, 9am to 5pm. We are closed on weekends and public holidays.",
+        "tenant": 1,
+    },
+    {
+        "title": "Appointment Scheduling",
+        "content": "Schedule appointments through our patient portal or by calling 555-987-6543. Same-day appointments may be available.",
+        "tenant": 0,
+    },
+    {
+        "title": "Lab Results",
+        "content": "Lab results are typically available within 24-48 hours. You can view them in the patient portal under Results.",
+        "tenant": 0,
+    },
+    {
+        "title": "Prescription Refills",
+        "content": "Request prescription refills through the patient portal or by calling our pharmacy line at 555-321-7654. Allow 24 hours for processing.",
+        "tenant": 0,
+    },
+    {
+        "title": "Contact Your Provider",
+        "content": "Send a secure message to your provider anytime through the patient portal. Urgent matters should call our main line.",
+        "tenant": 0,
+    },
+)
+
+# Audit logs, loaded via COPY in AUDIT_COLUMNS order
+AUDIT_ROWS: tuple[tuple, ...] = (
+    ("Auth Service", "User Login", "admin@aurixa.io", "Successful admin login from 192.168.1.1", "info"),
+    ("API Gateway", "Rate Limit Hit", "tenant-key-03", "Rate limit approached: 180 req/min on /api/v1/pipelines", "warning"),
+    ("Orchestration Engine", "Pipeline Complete", "system", "Pipeline session conv-abc123 completed successfully", "info"),
+    ("Notification Hub", "Service Degraded", "system", "High memory usage detected: 85% utilization", "error"),
+    ("Orchestration Engine", "Deployment", "deploy-bot", "Successfully deployed v0.1.0 to production", "info"),
+    ("Auth Service", "API Key Created", "admin@generalhospital.com", "New API key issued for General Hospital (prod-key-06)", "info"),
+    ("RAG Service", "Threshold Alert", "system", "Retrieval latency p95 exceeded 500ms", "warning"),
+    ("LLM Router", "Provider Fallback", "system", "OpenAI timeout, fell back to Anthropic", "warning"),
+    ("API Gateway", "Config Update", "admin@aurixa.io", "Updated CORS policy for tenant Downtown Clinic", "info"),
+    ("Safety Guardrails", "Content Filter", "system", "Blocked inappropriate content in pipeline session xyz789", "info"),
+)
+
+# Platform config (for Configuration page)
+CONFIG_ROWS: tuple[dict, ...] = (
+    {"key": "rate_limit_per_minute", "value": "200", "category": "rate_limit"},
+    {"key": "max_conversations_per_tenant", "value": "10000", "category": "rate_limit"},
+    {"key": "feature_rag_enabled", "value": "true", "category": "feature"},
+    {"key": "feature_voice_enabled", "value": "true", "category": "feature"},
+    {"key": "feature_safety_guardrails", "value": "true", "category": "feature"},
+    {"key": "api_gateway_timeout_ms", "value": "30000", "category": "api"},
+    {"key": "default_llm_provider", "value": "openai", "category": "api"},
+    {"key": "environment", "value": "development", "category": "general"},
+    {"key": "maintenance_mode", "value": "false", "category": "general"},
+)
+
+SLOT_COLUMNS = ["slot_date", "start_time", "end_time", "provider_name", "tenant_id"]
+AUDIT_COLUMNS = ["service", "action", "user", "details", "severity"]
+
+# Statements are built once so the engine's compiled cache serves every batch;
+# each execute() only rebinds the parameter list. Parent tables return just their
+# ids (in parameter order) so children can reference them without loading objects.
+TENANT_INSERT = insert(Tenant).returning(Tenant.id, sort_by_parameter_order=True)
+PATIENT_INSERT = insert(Patient).returning(Patient.id, sort_by_parameter_order=True)
+USER_INSERT = insert(User)
+STAFF_INSERT = insert(Staff)
+CONVERSATION_INSERT = insert(Conversation)
+APPOINTMENT_INSERT = insert(Appointment)
+INSURANCE_INSERT = insert(PatientInsurance)
+PRESCRIPTION_INSERT = insert(Prescription)
+KB_ARTICLE_INSERT = insert(KnowledgeBaseArticle)
+CONFIG_INSERT = insert(PlatformConfig)
+
+# One-shot script: open connections on demand, no pool bookkeeping or pre-ping SELECT 1.
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=NullPool,
+    echo=False,
+    insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
+)
+AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+# Upper bound on connections opened at once by the concurrent insert phase.
+_SEED_CONCURRENCY = asyncio.Semaphore(int(os.getenv("SEED_CONCURRENCY", "5")))
+DISPOSE_TIMEOUT_SEC = 5.0
+# Skip FK triggers inside seed transactions (session_replication_role = replica). Only
+# honoured for superusers; seed data is self-consistent, so the per-row FK lookups are waste.
+SEED_SKIP_FK_CHECKS = os.getenv("SEED_SKIP_FK_CHECKS", "true").lower() == "true"
+_replica_role = False
+
+
+def _resolve(
+    rows: tuple[dict, ...], tenant_ids: list[int], patient_ids: list[int] | None = None
+) -> list[dict]:
+    """Replace ``tenant`` / ``patient`` row indexes with the inserted primary keys."""
+    resolved = []
+    for row in rows:
+        row = dict(row)
+        if "tenant" in row:
+            row["tenant_id"] = tenant_ids[row.pop("tenant")]
+        if "patient" in row:
+            row["patient_id"] = patient_ids[row.pop("patient")]
+        resolved.append(row)
+    return resolved
+
+
+async def _copy_records(
+    db: AsyncSession, model: type[Base], columns: list[str], records: list[tuple]
+) -> None:
+    """Bulk-load rows with asyncpg's binary COPY; plain executemany INSERT on other drivers.
+
+    Omitted columns (``id``, ``created_at``, ``updated_at``) take their server defaults.
+    COPY runs on the session's transaction connection, replica role or not, so it
+    commits or rolls back with the rest of the batch.
+    """
+    if db.bind.dialect.driver == "asyncpg":
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            model.__tablename__, records=records, columns=columns
+        )
+    else:
+        await db.execute(insert(model), [dict(zip(columns, r)) for r in records])
+
+
+async def _enable_replica_role() -> None:
+    """Turn on FK-trigger skipping for seed transactions when the role allows it."""
+    global _replica_role
+    if not SEED_SKIP_FK_CHECKS or engine.dialect.name != "postgresql":
+        return
+    async with engine.connect() as conn:
+        _replica_role = (await conn.scalar(text("SELECT current_setting('is_superuser')"))) == "on"
+    if not _replica_role:
+        logger.info("Not a superuser; seeding with FK checks enabled.")
+
+
+async def _begin_bulk(db: AsyncSession) -> None:
+    """Start-of-transaction setup for bulk seeding; SET LOCAL reverts on commit/rollback."""
+    if _replica_role:
+        await db.execute(text("SET LOCAL session_replication_role = 'replica'"))
+
+
+async def _insert_rows(stmt, rows: list[dict]) -> None:
+    """Run one independent executemany batch on its own session."""
+    async with _SEED_CONCURRENCY, AsyncSessionLocal() as db, db.begin():
+        await _begin_bulk(db)
+        await db.execute(stmt, rows)
 
-async def seed_database():
-    """Wipe and re-seed the database with mock data."""
-    
+
+async def _copy_rows(model: type[Base], columns: list[str], records: list[tuple]) -> None:
+    """Run one independent COPY batch on its own session."""
+    async with _SEED_CONCURRENCY, AsyncSessionLocal() as db, db.begin():
+        await _begin_bulk(db)
+        await _copy_records(db, model, columns, records)
+
+
+def _table_list() -> str:
+    """Comma-separated, quoted names of every mapped table."""
+    preparer = engine.dialect.identifier_preparer
+    return ", ".join(preparer.format_table(t) for t in Base.metadata.sorted_tables)
+
+
+def _enum_type_names() -> list[str]:
+    """Quoted names of the named ENUM types used by mapped columns."""
+    preparer = engine.dialect.identifier_preparer
+    names = {
+        col.type.name
+        for table in Base.metadata.sorted_tables
+        for col in table.columns
+        if isinstance(col.type, Enum) and col.type.name
+    }
+    return [preparer.quote(name) for name in sorted(names)]
+
+
+# Column types introduced after the original schema (compiled DDL name ->
+# information_schema udt_name). A live column still on its old type needs --migrate.
+_UPGRADED_UDT_NAMES = {
+    "JSONB": "jsonb",
+    "CITEXT": "citext",
+    "TSVECTOR": "tsvector",
+    "TIMESTAMP WITH TIME ZONE": "timestamptz",
+}
+
+LIVE_COLUMNS = text(
+    "SELECT table_name, column_name, udt_name FROM information_schema.columns"
+    " WHERE table_schema = current_schema()"
+)
+
+
+def _expected_udt_name(column) -> str | None:
+    """udt_name the live column must have, for the upgraded types only."""
+    if isinstance(column.type, Enum) and column.type.name:
+        return column.type.name
+    return _UPGRADED_UDT_NAMES.get(column.type.compile(dialect=engine.dialect))
+
+
+async def _schema_drift(conn) -> list[str]:
+    """Columns of existing tables that are missing or still on a pre-upgrade type."""
+    live = {(t, c): udt for t, c, udt in (await conn.execute(LIVE_COLUMNS)).all()}
+    live_tables = {t for t, _ in live}
+    drift = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in live_tables:
+            continue  # created below
+        for column in table.columns:
+            udt = live.get((table.name, column.name))
+            expected = _expected_udt_name(column)
+            if udt is None:
+                drift.append(f"{table.name}.{column.name} (missing)")
+            elif expected is not None and udt != expected:
+                drift.append(f"{table.name}.{column.name} ({udt}, expected {expected})")
+    return drift
+
+
+async def _recreate_schema() -> None:
+    """Drop and recreate every table (needed after model/DDL changes)."""
     async with engine.begin() as conn:
         logger.info("Dropping all tables...")
-        await conn.run_sync(Base.metadata.drop_all)
+        if conn.dialect.name == "postgresql":
+            # One DROP for every table instead of an information_schema probe + DROP per table.
+            await conn.execute(text(f"DROP TABLE IF EXISTS {_table_list()} CASCADE"))
+            # ENUM types outlive their tables; drop them so create_all can recreate them.
+            enum_types = ", ".join(_enum_type_names())
+            if enum_types:
+                await conn.execute(text(f"DROP TYPE IF EXISTS {enum_types} CASCADE"))
+        else:
+            await conn.run_sync(Base.metadata.drop_all)
         logger.info("Creating all tables...")
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with AsyncSessionLocal() as db:
-        logger.info("Seeding database...")
-
-        # Create Tenants (AURIXA healthcare tenants)
-        tenants = [
-            Tenant(name="General Hospital", domain="generalhospital.com", plan="enterprise", status="active", api_key_count=5),
-            Tenant(name="Downtown Clinic", domain="downtownclinic.org", plan="professional", status="active", api_key_count=3),
-            Tenant(name="Sunrise Medical Center", domain="sunrisemedical.com", plan="enterprise", status="active", api_key_count=8),
-            Tenant(name="Family Care Associates", domain="familycare.net", plan="starter", status="active", api_key_count=1),
-            Tenant(name="Metro Health Systems", domain="metrohealth.io", plan="professional", status="suspended", api_key_count=2),
-            Tenant(name="Valley View Hospital", domain="valleyview.org", plan="enterprise", status="active", api_key_count=6),
-            Tenant(name="Riverside Clinic", domain="riversideclinic.com", plan="starter", status="pending", api_key_count=0),
-        ]
-        for t in tenants:
-            db.add(t)
-        await db.commit()
-
-        # Create Users
-        users = [
-            User(email="admin@generalhospital.com", hashed_password="fake-password", full_name="Admin GH", tenant_id=tenants[0].id),
-            User(email="staff@downtownclinic.org", hashed_password="fake-password", full_name="Staff DC", tenant_id=tenants[1].id),
-        ]
-        for u in users:
-            db.add(u)
-        await db.commit()
-
-        # Create Staff (hospital workers per tenant)
-        staff_list = [
-            Staff(full_name="Sarah Chen", email="sarah.chen@generalhospital.com", role="reception", tenant_id=tenants[0].id),
-            Staff(full_name="Mike Johnson", email="mike.j@generalhospital.com", role="nurse", tenant_id=tenants[0].id),
-            Staff(full_name="Dr. Adams", email="adam.m@generalhospital.com", role="doctor", tenant_id=tenants[0].id),
-            Staff(full_name="Dr. Bell", email="bell.d@generalhospital.com", role="doctor", tenant_id=tenants[0].id),
-            Staff(full_name="Dr. Chen", email="chen.l@generalhospital.com", role="doctor", tenant_id=tenants[0].id),
-            Staff(full_name="Emma Wilson", email="emma.w@generalhospital.com", role="scheduler", tenant_id=tenants[0].id),
-            Staff(full_name="Admin GH", email="admin@generalhospital.com", role="admin", tenant_id=tenants[0].id),
-            Staff(full_name="Reception DC", email="reception@downtownclinic.org", role="reception", tenant_id=tenants[1].id),
-            Staff(full_name="Dr. Bell", email="bell.d@downtownclinic.org", role="doctor", tenant_id=tenants[1].id),
-        ]
-        for s in staff_list:
-            db.add(s)
-        await db.commit()
-
-        # Create Conversations (for analytics)
-        conversations = [
-            Conversation(session_id="conv-001", meta_data={"tenant_id": 1, "user_id": "u1"}),
-            Conversation(session_id="conv-002", meta_data={"tenant_id": 1, "user_id": "u2"}),
-            Conversation(session_id="conv-003", meta_data={"tenant_id": 2, "user_id": "u1"}),
-        ]
-        for c in conversations:
-            db.add(c)
-        await db.commit()
-
-        # Create Patients (linked to tenants)
-        patients = [
-            Patient(full_name="John Doe", email="john.doe@email.com", tenant_id=tenants[0].id),
-            Patient(full_name="Jane Smith", phone_number="123-456-7890", tenant_id=tenants[1].id),
-            Patient(full_name="Alice Johnson", email="alice.j@email.com", phone_number="555-0101", tenant_id=tenants[0].id),
-            Patient(full_name="Bob Williams", email="bob.w@email.com", tenant_id=tenants[0].id),
-            Patient(full_name="Carol Davis", phone_number="555-0102", tenant_id=tenants[1].id),
-        ]
-        for p in patients:
-            db.add(p)
-        await db.commit()
-
-        # Create Appointments (use naive UTC for TIMESTAMP WITHOUT TIME ZONE columns)
-        # Use naive UTC for PostgreSQL TIMESTAMP WITHOUT TIME ZONE
-        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
-        appointments = [
-            Appointment(
-                start_time=now + datetime.timedelta(days=1),
-                end_time=now + datetime.timedelta(days=1, hours=1),
-                provider_name="Dr. Adams",
-                reason="Annual checkup",
-                status="confirmed",
-                tenant_id=tenants[0].id,
-                patient_id=patients[0].id,
-            ),
-            Appointment(
-                start_time=now + datetime.timedelta(days=2),
-                end_time=now + datetime.timedelta(days=2, hours=1),
-                provider_name="Dr. Bell",
-                reason="Follow-up",
-                status="confirmed",
-                tenant_id=tenants[1].id,
-                patient_id=patients[1].id,
-            ),
-            Appointment(
-                start_time=now + datetime.timedelta(days=3),
-                end_time=now + datetime.timedelta(days=3, hours=1),
-                provider_name="Dr. Chen",
-                reason="Lab review",
-                status="completed",
-                tenant_id=tenants[0].id,
-                patient_id=patients[0].id,
-            ),
-            Appointment(
-                start_time=now + datetime.timedelta(days=5),
-                end_time=now + datetime.timedelta(days=5, hours=1),
-                provider_name="Dr. Adams",
-                reason="General visit",
-                status="confirmed",
-                tenant_id=tenants[0].id,
-                patient_id=patients[2].id,
-            ),
-        ]
-        for a in appointments:
-            db.add(a)
-        await db.commit()
-
-        # Create Patient Insurance
-        insurances = [
-            PatientInsurance(patient_id=patients[0].id, plan_name="In-Network PPO", payer="Aetna", copay="$25", status="active"),
-            PatientInsurance(patient_id=patients[1].id, plan_name="UnitedHealthcare", payer="UHC", member_id="UHC-12345", copay="$30", status="active"),
-            PatientInsurance(patient_id=patients[2].id, plan_name="Blue Cross PPO", payer="BCBS", copay="$20", status="active"),
-            PatientInsurance(patient_id=patients[3].id, plan_name="Medicare", payer="CMS", copay="$0", status="active"),
-        ]
-        for i in insurances:
-            db.add(i)
-        await db.commit()
-
-        # Create Prescriptions
-        prescriptions = [
-            Prescription(patient_id=patients[0].id, medication_name="Lisinopril 10mg", status="active"),
-            Prescription(patient_id=patients[0].id, medication_name="Metformin 500mg", status="active"),
-            Prescription(patient_id=patients[2].id, medication_name="Amlodipine 5mg", status="active"),
-        ]
-        for pr in prescriptions:
-            db.add(pr)
-        await db.commit()
-
-        # Create Availability Slots (next 7 days)
-        today = datetime.date.today()
-        providers = ["Dr. Adams", "Dr. Bell", "Dr. Chen"]
-        for d in range(7):
-            slot_date = today + datetime.timedelta(days=d)
-            for prov in providers:
-                for st, et in [("09:00", "09:30"), ("10:00", "10:30"), ("14:00", "14:30")]:
-                    db.add(AvailabilitySlot(
-                        slot_date=slot_date,
-                        start_time=st,
-                        end_time=et,
-                        provider_name=prov,
-                        tenant_id=tenants[0].id,
-                    ))
-        await db.commit()
-
-        # Create Knowledge Base Articles (patient-facing FAQ + admin)
-        kb_articles = [
-            KnowledgeBaseArticle(
-                title="Billing Inquiries",
-                content="For billing questions, please call 555-123-4567 or visit our patient portal. We accept most major insurance plans.",
-                tenant_id=tenants[0].id,
-            ),
-            KnowledgeBaseArticle(
-                title="Operating Hours",
-                content="Our clinic is open Monday to Friday, 9am to 5pm. We are closed on weekends and public holidays.",
-                tenant_id=tenants[1].id,
-            ),
-            KnowledgeBaseArticle(
-                title="Appointment Scheduling",
-                content="Schedule appointments through our patient portal or by calling 555-987-6543. Same-day appointments may be available.",
-                tenant_id=tenants[0].id,
-            ),
-            KnowledgeBaseArticle(
-                title="Lab Results",
-                content="Lab results are typically available within 24-48 hours. You can view them in the patient portal under Results.",
-                tenant_id=tenants[0].id,
-            ),
-            KnowledgeBaseArticle(
-                title="Prescription Refills",
-                content="Request prescription refills through the patient portal or by calling our pharmacy line at 555-321-7654. Allow 24 hours for processing.",
-                tenant_id=tenants[0].id,
-            ),
-            KnowledgeBaseArticle(
-                title="Contact Your Provider",
-                content="Send a secure message to your provider anytime through the patient portal. Urgent matters should call our main line.",
-                tenant_id=tenants[0].id,
-            ),
-        ]
-        for kb in kb_articles:
-            db.add(kb)
-        await db.commit()
-
-        # Create Audit Logs
-        audit_logs = [
-            AuditLog(service="Auth Service", action="User Login", user="admin@aurixa.io", details="Successful admin login from 192.168.1.1", severity="info"),
-            AuditLog(service="API Gateway", action="Rate Limit Hit", user="tenant-key-03", details="Rate limit approached: 180 req/min on /api/v1/pipelines", severity="warning"),
-            AuditLog(service="Orchestration Engine", action="Pipeline Complete", user="system", details="Pipeline session conv-abc123 completed successfully", severity="info"),
-            AuditLog(service="Notification Hub", action="Service Degraded", user="system", details="High memory usage detected: 85% utilization", severity="error"),
-            AuditLog(service="Orchestration Engine", action="Deployment", user="deploy-bot", details="Successfully deployed v0.1.0 to production", severity="info"),
-            AuditLog(service="Auth Service", action="API Key Created", user="admin@generalhospital.com", details="New API key issued for General Hospital (prod-key-06)", severity="info"),
-            AuditLog(service="RAG Service", action="Threshold Alert", user="system", details="Retrieval latency p95 exceeded 500ms", severity="warning"),
-            AuditLog(service="LLM Router", action="Provider Fallback", user="system", details="OpenAI timeout, fell back to Anthropic", severity="warning"),
-            AuditLog(service="API Gateway", action="Config Update", user="admin@aurixa.io", details="Updated CORS policy for tenant Downtown Clinic", severity="info"),
-            AuditLog(service="Safety Guardrails", action="Content Filter", user="system", details="Blocked inappropriate content in pipeline session xyz789", severity="info"),
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+
+
+async def _truncate_schema() -> None:
+    """Empty every table but keep tables, indexes and constraints in place.
+
+    Creates any missing tables first when the database is fresh. Refuses to touch
+    a database whose existing tables predate the current models.
+    """
+    truncate = text(f"TRUNCATE TABLE {_table_list()} RESTART IDENTITY CASCADE")
+    async with engine.connect() as conn:
+        drift = await _schema_drift(conn)
+    if drift:
+        raise RuntimeError(
+            "Database schema is out of date; re-run with --migrate to drop and recreate it. "
+            f"Outdated columns: {', '.join(drift)}"
+        )
+    try:
+        async with engine.begin() as conn:
+            logger.info("Truncating all tables...")
+            await conn.execute(truncate)
+    except ProgrammingError:
+        # UndefinedTableError: fresh (or partial) schema.
+        async with engine.begin() as conn:
+            logger.info("Creating missing tables...")
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(truncate)
+
+
+async def _clear_partial_seed() -> None:
+    """Remove rows committed by the batches that finished before a failure."""
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text(f"TRUNCATE TABLE {_table_list()} RESTART IDENTITY CASCADE"))
+        else:
+            for table in reversed(Base.metadata.sorted_tables):
+                await conn.execute(table.delete())
+
+
+async def seed_database(profile: str = "full", migrate: bool = False):
+    """Wipe and re-seed the database with mock data for the given profile.
+
+    Tables are truncated by default; ``migrate`` drops and recreates them instead.
+    """
+    level = PROFILES.index(profile)
+
+    if migrate or engine.dialect.name != "postgresql":
+        await _recreate_schema()
+    else:
+        await _truncate_schema()
+    await _enable_replica_role()
+
+    async with AsyncSessionLocal() as db, db.begin():
+        logger.info("Seeding database (profile={})...", profile)
+        await _begin_bulk(db)
+        tenant_ids = (await db.execute(TENANT_INSERT, list(TENANT_ROWS))).scalars().all()
+        patient_ids = (
+            await db.execute(PATIENT_INSERT, _resolve(PATIENT_ROWS, tenant_ids))
+        ).scalars().all()
+
+    # Use naive UTC for PostgreSQL TIMESTAMP WITHOUT TIME ZONE
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    starts = {k: now + offset for k, offset in DAY_OFFSETS.items()}
+    appointments = _resolve(APPOINTMENT_ROWS, tenant_ids, patient_ids)
+    for row in appointments:
+        row["start_time"] = starts[row.pop("day")]
+        row["end_time"] = row["start_time"] + ONE_HOUR
+
+    today = datetime.date.today()
+    slot_dates = [today + datetime.timedelta(days=d) for d in range(SLOT_DAYS)]
+    slot_records = [
+        (slot_date, st, et, prov, tenant_ids[0])
+        for slot_date in slot_dates
+        for prov in PROVIDERS
+        for st, et in SLOT_TIMES
+    ]
+
+    # The remaining batches only need tenant/patient ids, so each runs on its own
+    # session (and connection) concurrently instead of queueing on one.
+    batches = [
+        _insert_rows(USER_INSERT, _resolve(USER_ROWS, tenant_ids)),
+        _insert_rows(CONFIG_INSERT, list(CONFIG_ROWS)),
+    ]
+    if level >= PROFILES.index("standard"):
+        batches += [
+            _insert_rows(STAFF_INSERT, _resolve(STAFF_ROWS, tenant_ids)),
+            _insert_rows(APPOINTMENT_INSERT, appointments),
+            _insert_rows(INSURANCE_INSERT, _resolve(INSURANCE_ROWS, tenant_ids, patient_ids)),
+            _insert_rows(PRESCRIPTION_INSERT, _resolve(PRESCRIPTION_ROWS, tenant_ids, patient_ids)),
+            _insert_rows(KB_ARTICLE_INSERT, _resolve(KB_ROWS, tenant_ids)),
         ]
-        for log in audit_logs:
-            db.add(log)
-        await db.commit()
-
-        # Create Platform Config (for Configuration page)
-        config_entries = [
-            PlatformConfig(key="rate_limit_per_minute", value="200", category="rate_limit"),
-            PlatformConfig(key="max_conversations_per_tenant", value="10000", category="rate_limit"),
-            PlatformConfig(key="feature_rag_enabled", value="true", category="feature"),
-            PlatformConfig(key="feature_voice_enabled", value="true", category="feature"),
-            PlatformConfig(key="feature_safety_guardrails", value="true", category="feature"),
-            PlatformConfig(key="api_gateway_timeout_ms", value="30000", category="api"),
-            PlatformConfig(key="default_llm_provider", value="openai", category="api"),
-            PlatformConfig(key="environment", value="development", category="general"),
-            PlatformConfig(key="maintenance_mode", value="false", category="general"),
+    if level >= PROFILES.index("full"):
+        batches += [
+            _insert_rows(CONVERSATION_INSERT, list(CONVERSATION_ROWS)),
+            _copy_rows(AvailabilitySlot, SLOT_COLUMNS, slot_records),
+            _copy_rows(AuditLog, AUDIT_COLUMNS, list(AUDIT_ROWS)),
         ]
-        for c in config_entries:
-            db.add(c)
-        await db.commit()
+    tasks = [asyncio.ensure_future(batch) for batch in batches]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # Let every sibling finish rolling back before main() disposes the engine,
+        # otherwise a cancelled checkout can leave dispose() waiting forever.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Each batch commits on its own; undo the ones that succeeded so a failed
+        # run never leaves a partially seeded database behind.
+        try:
+            await _clear_partial_seed()
+        except Exception as exc:
+            logger.error("Could not clear partially seeded tables: {}", exc)
+        raise
 
-        logger.info("Database seeding complete.")
+    logger.info("Database seeding complete.")
 
 
-async def main():
+async def main(profile: str = "full", migrate: bool = False):
     try:
-        await seed_database()
+        await seed_database(profile, migrate)
     finally:
-        await engine.dispose()
+        # Cap shutdown so a stuck connection cannot leave a zombie seed process in CI.
+        await asyncio.wait_for(engine.dispose(), timeout=DISPOSE_TIMEOUT_SEC)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Wipe and re-seed the AURIXA database.")
+    parser.add_argument("--profile", choices=PROFILES, default="full", help="Amount of mock data to seed.")
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Drop and recreate all tables instead of truncating them (use after model changes).",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.profile, args.migrate))
@@ -1,7 +1,12 @@
 """AURIXA Database Package."""
 
 from .base import Base
-from .database import engine, AsyncSessionLocal, get_db_session
+from .database import (
+    engine, AsyncSessionLocal, get_db_session, read_engine, get_read_db_session, bulk_insert,
+)
 from . import models
 
-__all__ = ["Base", "engine", "AsyncSessionLocal", "get_db_session", "models"]
+__all__ = [
+    "Base", "engine", "AsyncSessionLocal", "get_db_session",
+    "read_engine", "get_read_db_session", "bulk_insert", "models",
+]
@@ -7,11 +7,15 @@ import datetime
 
 class Base(DeclarativeBase):
     """Base for all models, includes primary key and audit columns."""
+    # Fetch server-generated values (updated_at on UPDATE) via RETURNING instead of
+    # expiring them, so async sessions never lazy-load them after a flush.
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
         server_default=text("TIMEZONE('utc', now())")
     )
     updated_at: Mapped[datetime.datetime] = mapped_column(
         server_default=text("TIMEZONE('utc', now())"),
-        onupdate=datetime.datetime.utcnow,
+        onupdate=text("TIMEZONE('utc', now())"),
     )
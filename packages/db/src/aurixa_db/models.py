@@ -2,10 +2,41 @@
 
 from .base import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, JSON, ForeignKey, Text, Integer, Index
+from sqlalchemy import String, JSON, ForeignKey, Text, Integer, Index, Enum, DateTime, Computed, event
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB, TSVECTOR
 from typing import List, Dict, Any
 import datetime
 
+# Binary JSONB on PostgreSQL (indexable, no re-parse on read); generic JSON elsewhere.
+JSONDocument = JSON().with_variant(JSONB, "postgresql")
+# Case-insensitive text on PostgreSQL, so one unique index covers "A@x.com" vs "a@x.com".
+CaseInsensitiveText = String(255).with_variant(CITEXT(), "postgresql")
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_extensions(target, connection, **kw) -> None:
+    """CITEXT ships as an extension; make sure it exists before create_all emits DDL."""
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS citext")
+
+
+# Fixed vocabularies, stored as native PostgreSQL ENUM types (4 bytes per value).
+TENANT_PLANS = ("starter", "professional", "enterprise")
+TENANT_STATUSES = ("active", "suspended", "pending")
+STAFF_ROLES = ("reception", "nurse", "doctor", "scheduler", "admin")
+APPOINTMENT_STATUSES = ("confirmed", "cancelled", "completed")
+PRESCRIPTION_STATUSES = ("active", "refill_requested", "filled")
+
+
+def _gin_index(name: str, column: str) -> Index:
+    """GIN index for ``@>`` containment filters on a JSONB column."""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "jsonb_path_ops"})
+
+
+# Relationships use lazy="raise_on_sql": an unloaded relationship raises instead of
+# silently issuing one SELECT per access (N+1). Load them per query with
+# selectinload()/joinedload(), or Session.refresh(obj, ["attr"]).
+
 
 class AuditLog(Base):
     """Audit trail for system events."""
@@ -21,39 +52,56 @@ class AuditLog(Base):
 class Conversation(Base):
     """Represents a single conversation or session."""
     __tablename__ = "conversations"
+    # Serves the patient-conversations lookup: meta_data @> '{"patient_id": N}'.
+    __table_args__ = (_gin_index("ix_conversations_meta_data_gin", "meta_data"),)
 
     session_id: Mapped[str] = mapped_column(String, unique=True, index=True)
-    meta_data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=True)
+    meta_data: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=True)
 
-    pipeline_steps: Mapped[List["PipelineStep"]] = relationship(back_populates="conversation")
+    pipeline_steps: Mapped[List["PipelineStep"]] = relationship(back_populates="conversation", lazy="raise_on_sql")
 
 class PipelineStep(Base):
     """Represents a single step within a conversation pipeline."""
     __tablename__ = "pipeline_steps"
+    __table_args__ = (
+        Index("ix_pipeline_steps_conversation_start", "conversation_id", "start_time"),
+        # Rows arrive in start_time order, so a BRIN index serves time-window scans at a
+        # fraction of a B-tree's size.
+        Index("ix_pipeline_steps_start_brin", "start_time", postgresql_using="brin"),
+    )
 
     conversation_id: Mapped[int] = mapped_column(ForeignKey("conversations.id"))
     step_name: Mapped[str] = mapped_column(String)
     status: Mapped[str] = mapped_column(String)
-    input: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=True)
-    output: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=True)
+    input: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=True)
+    output: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=True)
     error_message: Mapped[str] = mapped_column(Text, nullable=True)
-    start_time: Mapped[float] = mapped_column(nullable=True)
-    end_time: Mapped[float] = mapped_column(nullable=True)
+    start_time: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    end_time: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Computed by PostgreSQL on write; NULL until the step has finished.
+    duration_ms: Mapped[int] = mapped_column(
+        Integer,
+        Computed("(EXTRACT(EPOCH FROM (end_time - start_time)) * 1000)::integer", persisted=True),
+        nullable=True,
+    )
 
-    conversation: Mapped["Conversation"] = relationship(back_populates="pipeline_steps")
+    conversation: Mapped["Conversation"] = relationship(back_populates="pipeline_steps", lazy="raise_on_sql")
 
 
 class Staff(Base):
     """Hospital staff (reception, nurse, doctor, scheduler, admin)."""
     __tablename__ = "staff"
+    __table_args__ = (
+        Index("ix_staff_tenant_role_active", "tenant_id", "role", "is_active"),
+    )
 
     full_name: Mapped[str] = mapped_column(String)
     email: Mapped[str] = mapped_column(String, nullable=True)
-    role: Mapped[str] = mapped_column(String, default="reception")  # reception, nurse, doctor, scheduler, admin
+    role: Mapped[str] = mapped_column(Enum(*STAFF_ROLES, name="staff_role"), default="reception")
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"))
     is_active: Mapped[bool] = mapped_column(default=True)
 
-    tenant: Mapped["Tenant"] = relationship(back_populates="staff")
+    tenant: Mapped["Tenant"] = relationship(back_populates="staff", lazy="raise_on_sql")
 
 
 class Tenant(Base):
@@ -62,26 +110,26 @@ class Tenant(Base):
 
     name: Mapped[str] = mapped_column(String, unique=True)
     domain: Mapped[str] = mapped_column(String, unique=True, nullable=True)
-    plan: Mapped[str] = mapped_column(String, default="starter")  # starter, professional, enterprise
-    status: Mapped[str] = mapped_column(String, default="active")  # active, suspended, pending
+    plan: Mapped[str] = mapped_column(Enum(*TENANT_PLANS, name="tenant_plan"), default="starter")
+    status: Mapped[str] = mapped_column(Enum(*TENANT_STATUSES, name="tenant_status"), default="active")
     api_key_count: Mapped[int] = mapped_column(Integer, default=0)
 
-    users: Mapped[List["User"]] = relationship(back_populates="tenant")
-    staff: Mapped[List["Staff"]] = relationship(back_populates="tenant")
-    appointments: Mapped[List["Appointment"]] = relationship(back_populates="tenant")
-    knowledge_articles: Mapped[List["KnowledgeBaseArticle"]] = relationship(back_populates="tenant")
+    users: Mapped[List["User"]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    staff: Mapped[List["Staff"]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    appointments: Mapped[List["Appointment"]] = relationship(back_populates="tenant", lazy="raise_on_sql")
+    knowledge_articles: Mapped[List["KnowledgeBaseArticle"]] = relationship(back_populates="tenant", lazy="raise_on_sql")
 
 class User(Base):
     """Represents a user of the AURIXA admin console or dashboard."""
     __tablename__ = "users"
 
-    email: Mapped[str] = mapped_column(String, unique=True, index=True)
+    email: Mapped[str] = mapped_column(CaseInsensitiveText, unique=True, index=True)
     hashed_password: Mapped[str] = mapped_column(String)
     full_name: Mapped[str] = mapped_column(String, nullable=True)
     is_active: Mapped[bool] = mapped_column(default=True)
     
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"))
-    tenant: Mapped["Tenant"] = relationship(back_populates="users")
+    tenant: Mapped["Tenant"] = relationship(back_populates="users", lazy="raise_on_sql")
 
 class Patient(Base):
     """Represents an end-user of a tenant (e.g., a patient)."""
@@ -92,9 +140,9 @@ class Patient(Base):
     phone_number: Mapped[str] = mapped_column(String, nullable=True)
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"), nullable=True)
 
-    appointments: Mapped[List["Appointment"]] = relationship(back_populates="patient")
-    insurance: Mapped[List["PatientInsurance"]] = relationship(back_populates="patient")
-    prescriptions: Mapped[List["Prescription"]] = relationship(back_populates="patient")
+    appointments: Mapped[List["Appointment"]] = relationship(back_populates="patient", lazy="raise_on_sql")
+    insurance: Mapped[List["PatientInsurance"]] = relationship(back_populates="patient", lazy="raise_on_sql")
+    prescriptions: Mapped[List["Prescription"]] = relationship(back_populates="patient", lazy="raise_on_sql")
 
 
 class PatientInsurance(Base):
@@ -108,7 +156,7 @@ class PatientInsurance(Base):
     copay: Mapped[str] = mapped_column(String, default="$25")  # e.g., "$25"
     status: Mapped[str] = mapped_column(String, default="active")  # active, inactive
 
-    patient: Mapped["Patient"] = relationship(back_populates="insurance")
+    patient: Mapped["Patient"] = relationship(back_populates="insurance", lazy="raise_on_sql")
 
 
 class Prescription(Base):
@@ -117,15 +165,20 @@ class Prescription(Base):
 
     patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"))
     medication_name: Mapped[str] = mapped_column(String)
-    status: Mapped[str] = mapped_column(String, default="active")  # active, refill_requested, filled
+    status: Mapped[str] = mapped_column(
+        Enum(*PRESCRIPTION_STATUSES, name="prescription_status"), default="active"
+    )
     refill_requested_at: Mapped[datetime.datetime] = mapped_column(nullable=True)
 
-    patient: Mapped["Patient"] = relationship(back_populates="prescriptions")
+    patient: Mapped["Patient"] = relationship(back_populates="prescriptions", lazy="raise_on_sql")
 
 
 class AvailabilitySlot(Base):
     """Available appointment slots (for scheduling)."""
     __tablename__ = "availability_slots"
+    __table_args__ = (
+        Index("ix_availability_slots_tenant_date_start", "tenant_id", "slot_date", "start_time"),
+    )
 
     slot_date: Mapped[datetime.date] = mapped_column()
     start_time: Mapped[str] = mapped_column(String)  # e.g., "09:00"
@@ -139,30 +192,45 @@ class Appointment(Base):
     __tablename__ = "appointments"
     __table_args__ = (
         Index("ix_appointments_patient_status_start", "patient_id", "status", "start_time"),
+        Index("ix_appointments_tenant_start", "tenant_id", "start_time"),
+        Index("ix_appointments_tenant_provider_start", "tenant_id", "provider_name", "start_time"),
     )
 
     start_time: Mapped[datetime.datetime] = mapped_column()
     end_time: Mapped[datetime.datetime] = mapped_column()
     provider_name: Mapped[str] = mapped_column(String)  # e.g., Dr. Smith
     reason: Mapped[str] = mapped_column(String, nullable=True)  # e.g., "Annual checkup"
-    status: Mapped[str] = mapped_column(String, default="confirmed")  # confirmed, cancelled, completed
+    status: Mapped[str] = mapped_column(
+        Enum(*APPOINTMENT_STATUSES, name="appointment_status"), default="confirmed"
+    )
 
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"))
-    tenant: Mapped["Tenant"] = relationship(back_populates="appointments")
+    tenant: Mapped["Tenant"] = relationship(back_populates="appointments", lazy="raise_on_sql")
     
     patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"))
-    patient: Mapped["Patient"] = relationship(back_populates="appointments")
+    patient: Mapped["Patient"] = relationship(back_populates="appointments", lazy="raise_on_sql")
 
 class KnowledgeBaseArticle(Base):
     """Represents an article in the RAG knowledge base."""
     __tablename__ = "knowledge_base_articles"
+    __table_args__ = (
+        _gin_index("ix_knowledge_base_articles_meta_data_gin", "meta_data"),
+        Index("ix_knowledge_base_articles_search_gin", "search_vector", postgresql_using="gin"),
+    )
 
     title: Mapped[str] = mapped_column(String)
     content: Mapped[str] = mapped_column(Text)
-    meta_data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=True)
+    meta_data: Mapped[Dict[str, Any]] = mapped_column(JSONDocument, nullable=True)
+    # Full-text index over title + content, maintained by PostgreSQL. Deferred so
+    # article listings never ship the tsvector; filter with search_vector.op("@@")(...).
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', title || ' ' || content)", persisted=True),
+        deferred=True,
+    )
 
     tenant_id: Mapped[int] = mapped_column(ForeignKey("tenants.id"))
-    tenant: Mapped["Tenant"] = relationship(back_populates="knowledge_articles")
+    tenant: Mapped["Tenant"] = relationship(back_populates="knowledge_articles", lazy="raise_on_sql")
 
 
 class PlatformConfig(Base):
@@ -172,3 +240,8 @@ class PlatformConfig(Base):
     key: Mapped[str] = mapped_column(String, unique=True, index=True)
     value: Mapped[str] = mapped_column(Text)
     category: Mapped[str] = mapped_column(String, default="general")  # general, rate_limit, feature, api
+
+
+# Resolve every relationship/back_populates once at import instead of on the first
+# query, so request latency never includes mapper configuration.
+Base.registry.configure()
@@ -4,10 +4,10 @@ Provides a unified interface for OpenAI, Anthropic, Google Gemini,
 and OpenAI-compatible (LM Studio) backends with automatic fallback routing.
 """
 
-from .anthropic_client import AnthropicClient
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import LLMClient
-from .gemini_client import GeminiClient
-from .openai_client import OpenAIClient
 from .router import LLMRouter
 from .types import (
     LLMMessage,
@@ -19,6 +19,25 @@ from .types import (
     ToolDefinition,
 )
 
+if TYPE_CHECKING:
+    from .anthropic_client import AnthropicClient
+    from .gemini_client import GeminiClient
+    from .openai_client import OpenAIClient
+
+# Provider clients pull in their SDKs; resolve them on first attribute access.
+_LAZY_CLIENTS = {
+    "AnthropicClient": ".anthropic_client",
+    "GeminiClient": ".gemini_client",
+    "OpenAIClient": ".openai_client",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CLIENTS:
+        return getattr(importlib.import_module(_LAZY_CLIENTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "AnthropicClient",
     "GeminiClient",
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import time
 import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
+import httpx
 from loguru import logger
 
 from .base import LLMClient
@@ -32,9 +35,84 @@ _ANTHROPIC_PRICING: dict[str, dict[str, float]] = {
     "claude-3-haiku-20240307": {"prompt": 0.00025, "completion": 0.00125},
 }
 
+# Model family prefixes (id without the date suffix), precomputed for fallback matching.
+_PRICING_PREFIXES: tuple[tuple[str, dict[str, float]], ...] = tuple(
+    (key.rsplit("-", 1)[0], pricing) for key, pricing in _ANTHROPIC_PRICING.items()
+)
+
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_pricing(model: str) -> dict[str, float] | None:
+    """Exact pricing match, else the first family prefix the model id starts with."""
+    pricing = _ANTHROPIC_PRICING.get(model)
+    if pricing is None:
+        pricing = next((p for prefix, p in _PRICING_PREFIXES if model.startswith(prefix)), None)
+    return pricing
+
+
+# ----------------------------------------------------------------------
+# Message mapping
+# ----------------------------------------------------------------------
+
+
+def _map_tool_result(msg: LLMMessage) -> dict[str, Any]:
+    """Anthropic expects tool results as a user turn with a content-block list."""
+    return {
+        "role": "user",
+        "content": [
+            {
+                "type": "tool_result",
+                "tool_use_id": msg.tool_call_id or str(uuid.uuid4()),
+                "content": msg.content,
+            }
+        ],
+    }
+
+
+def _map_assistant(msg: LLMMessage) -> dict[str, Any]:
+    """Convert assistant tool calls to Anthropic's content-block format."""
+    tool_calls = msg.tool_calls
+    if not tool_calls:
+        return {"role": "assistant", "content": msg.content}
+    content_blocks: list[dict[str, Any]] = [{"type": "text", "text": msg.content}] if msg.content else []
+    content_blocks.extend(
+        {"type": "tool_use", "id": tc.id, "name": tc.name, "input": tc.arguments}
+        for tc in tool_calls
+    )
+    return {"role": "assistant", "content": content_blocks}
+
+
+def _map_default(msg: LLMMessage) -> dict[str, Any]:
+    return {"role": msg.role, "content": msg.content}
+
+
+# Per-role mappers for non-system messages; anything else passes through as-is.
+_MESSAGE_MAPPERS = {"tool": _map_tool_result, "assistant": _map_assistant}
+
+
+def _split_system(messages: list[LLMMessage]) -> tuple[str | None, list[dict[str, Any]]]:
+    """Separate the system prompt from conversation messages.
+
+    Anthropic requires the system prompt to be passed as a top-level
+    parameter rather than inside the messages array.  Multiple system
+    messages (rare but possible) are joined with newlines.
+    """
+    system_parts: list[str] = []
+    mapped: list[dict[str, Any]] = []
+    get_mapper = _MESSAGE_MAPPERS.get
+
+    for msg in messages:
+        role = msg.role
+        if role == "system":
+            system_parts.append(msg.content)
+        else:
+            mapped.append(get_mapper(role, _map_default)(msg))
+
+    return ("\n".join(system_parts) if system_parts else None), mapped
+
+
 class AnthropicClient(LLMClient):
     """Async client for the Anthropic Messages API.
 
@@ -43,6 +121,8 @@ class AnthropicClient(LLMClient):
         default_model: Model to use when the request does not specify one.
         timeout: HTTP request timeout in seconds.
         max_retries: Maximum number of automatic retries on transient errors.
+        http_client: Shared ``httpx.AsyncClient`` (connection pool) to send
+            requests through.  The SDK creates its own when omitted.
     """
 
     def __init__(
@@ -51,6 +131,7 @@ class AnthropicClient(LLMClient):
         default_model: str = DEFAULT_MODEL,
         timeout: float = 120.0,
         max_retries: int = 2,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         # Import lazily so the package can be installed without anthropic
         # if only other providers are used.
@@ -62,6 +143,7 @@ class AnthropicClient(LLMClient):
             api_key=self._api_key,
             timeout=timeout,
             max_retries=max_retries,
+            http_client=http_client,
         )
         logger.debug("AnthropicClient initialised (model={})", self._default_model)
 
@@ -71,19 +153,8 @@ class AnthropicClient(LLMClient):
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         """Send a message-creation request and return a normalised response."""
-        model = request.model or self._default_model
-        system_prompt, messages = self._split_system(request.messages)
-
-        kwargs: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "temperature": request.temperature,
-            "max_tokens": request.max_tokens,
-        }
-        if system_prompt:
-            kwargs["system"] = system_prompt
-        if request.tools:
-            kwargs["tools"] = self._map_tools(request.tools)
+        kwargs = self._build_kwargs(request)
+        model = kwargs["model"]
 
         start = time.perf_counter()
         try:
@@ -101,7 +172,7 @@ class AnthropicClient(LLMClient):
                 content_parts.append(block.text)
             elif block.type == "tool_use":
                 tool_calls.append(
-                    ToolCall(
+                    ToolCall.from_trusted(
                         id=block.id,
                         name=block.name,
                         arguments=block.input if isinstance(block.input, dict) else {},
@@ -123,12 +194,12 @@ class AnthropicClient(LLMClient):
             estimated_cost,
         )
 
-        return LLMResponse(
+        return LLMResponse.from_trusted(
             content=content,
             model=response.model,
             provider=LLMProvider.ANTHROPIC,
             tool_calls=tool_calls if tool_calls else None,
-            usage=TokenUsage(
+            usage=TokenUsage.from_trusted(
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
                 total_tokens=total_tokens,
@@ -138,6 +209,21 @@ class AnthropicClient(LLMClient):
             metadata={"stop_reason": response.stop_reason},
         )
 
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Stream text deltas from the Messages API as they arrive.
+
+        Closing the generator early exits the stream context, which closes the
+        underlying HTTP response so the model stops generating.
+        """
+        kwargs = self._build_kwargs(request)
+        try:
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as exc:
+            logger.error("Anthropic generate_stream failed for model {}: {}", kwargs["model"], exc)
+            raise
+
     async def health_check(self) -> bool:
         """Verify connectivity with a minimal request."""
         try:
@@ -158,13 +244,7 @@ class AnthropicClient(LLMClient):
         model: str | None = None,
     ) -> float:
         """Return estimated USD cost based on known pricing tables."""
-        model = model or self._default_model
-        pricing = _ANTHROPIC_PRICING.get(model)
-        if pricing is None:
-            for key in _ANTHROPIC_PRICING:
-                if model.startswith(key.rsplit("-", 1)[0]):
-                    pricing = _ANTHROPIC_PRICING[key]
-                    break
+        pricing = _resolve_pricing(model or self._default_model)
         if pricing is None:
             return 0.0
         return (prompt_tokens / 1000 * pricing["prompt"]) + (
@@ -175,64 +255,20 @@ class AnthropicClient(LLMClient):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _split_system(
-        messages: list[LLMMessage],
-    ) -> tuple[str | None, list[dict[str, Any]]]:
-        """Separate the system prompt from conversation messages.
-
-        Anthropic requires the system prompt to be passed as a top-level
-        parameter rather than inside the messages array.
-        """
-        system_prompt: str | None = None
-        mapped: list[dict[str, Any]] = []
-
-        for msg in messages:
-            if msg.role == "system":
-                # Concatenate multiple system messages (rare but possible).
-                system_prompt = (
-                    f"{system_prompt}\n{msg.content}" if system_prompt else msg.content
-                )
-                continue
-
-            if msg.role == "tool":
-                # Anthropic expects tool results with content as a list.
-                mapped.append(
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": msg.tool_call_id or str(uuid.uuid4()),
-                                "content": msg.content,
-                            }
-                        ],
-                    }
-                )
-                continue
-
-            entry: dict[str, Any] = {"role": msg.role, "content": msg.content}
-
-            # If the assistant message contains tool calls, convert them to
-            # Anthropic's content-block format.
-            if msg.role == "assistant" and msg.tool_calls:
-                content_blocks: list[dict[str, Any]] = []
-                if msg.content:
-                    content_blocks.append({"type": "text", "text": msg.content})
-                for tc in msg.tool_calls:
-                    content_blocks.append(
-                        {
-                            "type": "tool_use",
-                            "id": tc.id,
-                            "name": tc.name,
-                            "input": tc.arguments,
-                        }
-                    )
-                entry["content"] = content_blocks
-
-            mapped.append(entry)
-
-        return system_prompt, mapped
+    def _build_kwargs(self, request: LLMRequest) -> dict[str, Any]:
+        """Build Messages API arguments shared by ``generate`` and ``generate_stream``."""
+        system_prompt, messages = _split_system(request.messages)
+        kwargs: dict[str, Any] = {
+            "model": request.model or self._default_model,
+            "messages": messages,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        if request.tools:
+            kwargs["tools"] = self._map_tools(request.tools)
+        return kwargs
 
     @staticmethod
     def _map_tools(tools: list[ToolDefinition]) -> list[dict[str, Any]]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 
@@ -17,11 +18,20 @@ class LLMClient(ABC):
 
     async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
         """Stream completion tokens. Default: run generate() and yield full content once.
-        Override in providers that support streaming (e.g. OpenAI/LM Studio)."""
+        Override in providers that support streaming (e.g. OpenAI/LM Studio, Anthropic)."""
         response = await self.generate(request)
         if response.content:
             yield response.content
 
+    async def generate_many(self, requests: list[LLMRequest]) -> list[LLMResponse | BaseException]:
+        """Generate completions for several requests, results in request order.
+
+        Failures are returned in place rather than raised.  Default: concurrent
+        ``generate`` calls.  Override in providers with a native multi-prompt
+        endpoint to send the batch in one HTTP call.
+        """
+        return await asyncio.gather(*(self.generate(r) for r in requests), return_exceptions=True)
+
     @abstractmethod
     async def generate(self, request: LLMRequest) -> LLMResponse:
         """Generate a completion from the LLM.
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
+import re
+import secrets
 import time
-import uuid
+from collections import OrderedDict
 from typing import Any
 
 from loguru import logger
 
+# Optional dependency: resolved once at import so the request path never
+# re-enters the import machinery.  GeminiClient raises if it is missing.
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
 from .base import LLMClient
 from .types import (
     LLMMessage,
@@ -31,6 +42,39 @@ _GEMINI_PRICING: dict[str, dict[str, float]] = {
 
 DEFAULT_MODEL = "gemini-2.0-flash"
 
+# Prebuilt GenerativeModel instances kept per client (see GeminiClient._get_model).
+_MODEL_CACHE_SIZE = 32
+
+
+# Gemini function calls carry no id; mint process-unique ones without a
+# urandom syscall per call.
+def _reset_tool_call_ids() -> None:
+    global _TC_PREFIX, _tc_counter
+    _TC_PREFIX = f"gem-{os.getpid()}-{secrets.token_hex(4)}-"
+    _tc_counter = itertools.count()
+
+
+_reset_tool_call_ids()
+# Workers forked after import (preloading servers) must not share the parent's ids.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_tool_call_ids)
+
+# Gemini uses ``user`` and ``model`` roles (not ``assistant``).
+_ROLE_MAP: dict[str, str] = {"user": "user", "assistant": "model", "tool": "user"}
+
+# Longest-first alternation, so the first alternative that matches is the
+# longest known prefix (an exact id is its own longest prefix).
+_PRICING_RE = re.compile(
+    "^(" + "|".join(re.escape(k) for k in sorted(_GEMINI_PRICING, key=len, reverse=True)) + ")"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_pricing(model: str) -> dict[str, float] | None:
+    """Pricing for the longest known key the (possibly versioned) model id starts with."""
+    m = _PRICING_RE.match(model)
+    return _GEMINI_PRICING[m.group(1)] if m else None
+
 
 class GeminiClient(LLMClient):
     """Async client for the Google Generative AI (Gemini) API.
@@ -45,12 +89,13 @@ class GeminiClient(LLMClient):
         api_key: str | None = None,
         default_model: str = DEFAULT_MODEL,
     ) -> None:
-        import google.generativeai as genai
+        if genai is None:
+            raise ImportError("google-generativeai is required for GeminiClient")
 
         self._api_key = api_key or os.getenv("GOOGLE_AI_API_KEY", "")
         self._default_model = default_model
-        self._genai = genai
-        self._genai.configure(api_key=self._api_key)
+        self._model_cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        genai.configure(api_key=self._api_key)
         logger.debug("GeminiClient initialised (model={})", self._default_model)
 
     # ------------------------------------------------------------------
@@ -59,8 +104,6 @@ class GeminiClient(LLMClient):
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
         """Send a generation request and return a normalised response."""
-        import google.generativeai as genai
-
         model_name = request.model or self._default_model
 
         # Build generation config.
@@ -69,57 +112,47 @@ class GeminiClient(LLMClient):
             max_output_tokens=request.max_tokens,
         )
 
-        # Extract system instruction from messages.
-        system_instruction, conversation = self._split_messages(request.messages)
-
-        # Build the model instance.
-        model_kwargs: dict[str, Any] = {
-            "model_name": model_name,
-            "generation_config": generation_config,
-        }
-        if system_instruction:
-            model_kwargs["system_instruction"] = system_instruction
+        # Split out the system instruction; Gemini takes the rest as content dicts.
+        system_instruction, contents = self._prepare_messages(request.messages)
 
-        # Attach tools if provided.
-        if request.tools:
-            model_kwargs["tools"] = self._map_tools(request.tools)
-
-        model = genai.GenerativeModel(**model_kwargs)
-
-        # Gemini expects a list of Content objects or plain dicts.
-        contents = self._build_contents(conversation)
+        model = self._get_model(model_name, system_instruction, request.tools)
 
         start = time.perf_counter()
         try:
-            response = await model.generate_content_async(contents)
+            response = await model.generate_content_async(
+                contents, generation_config=generation_config
+            )
         except Exception as exc:
             logger.error("Gemini generate failed for model {}: {}", model_name, exc)
             raise
         latency_ms = (time.perf_counter() - start) * 1000
 
         # Parse response.
-        content_text = ""
+        text_parts: list[str] = []
         tool_calls: list[ToolCall] = []
 
         for candidate in response.candidates:
             for part in candidate.content.parts:
                 if part.text:
-                    content_text += part.text
-                if hasattr(part, "function_call") and part.function_call:
-                    fc = part.function_call
+                    text_parts.append(part.text)
+                fc = getattr(part, "function_call", None)
+                if fc:
                     tool_calls.append(
-                        ToolCall(
-                            id=str(uuid.uuid4()),
+                        ToolCall.from_trusted(
+                            id=f"{_TC_PREFIX}{next(_tc_counter)}",
                             name=fc.name,
                             arguments=dict(fc.args) if fc.args else {},
                         )
                     )
+        content_text = "".join(text_parts)
 
         # Token usage – Gemini exposes usage_metadata on the response.
-        prompt_tokens = getattr(response.usage_metadata, "prompt_token_count", 0) or 0
-        completion_tokens = (
-            getattr(response.usage_metadata, "candidates_token_count", 0) or 0
-        )
+        um = getattr(response, "usage_metadata", None)
+        if um is not None:
+            prompt_tokens = int(um.prompt_token_count or 0)
+            completion_tokens = int(um.candidates_token_count or 0)
+        else:
+            prompt_tokens = completion_tokens = 0
         total_tokens = prompt_tokens + completion_tokens
         estimated_cost = self.estimate_cost(prompt_tokens, completion_tokens, model_name)
 
@@ -132,12 +165,12 @@ class GeminiClient(LLMClient):
             estimated_cost,
         )
 
-        return LLMResponse(
+        return LLMResponse.from_trusted(
             content=content_text,
             model=model_name,
             provider=LLMProvider.GEMINI,
             tool_calls=tool_calls if tool_calls else None,
-            usage=TokenUsage(
+            usage=TokenUsage.from_trusted(
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
                 total_tokens=total_tokens,
@@ -149,7 +182,7 @@ class GeminiClient(LLMClient):
     async def health_check(self) -> bool:
         """Verify connectivity by listing available models."""
         try:
-            list(self._genai.list_models())
+            list(genai.list_models())
             return True
         except Exception as exc:
             logger.warning("Gemini health-check failed: {}", exc)
@@ -162,13 +195,7 @@ class GeminiClient(LLMClient):
         model: str | None = None,
     ) -> float:
         """Return estimated USD cost based on known pricing tables."""
-        model = model or self._default_model
-        pricing = _GEMINI_PRICING.get(model)
-        if pricing is None:
-            for key in _GEMINI_PRICING:
-                if model.startswith(key):
-                    pricing = _GEMINI_PRICING[key]
-                    break
+        pricing = _resolve_pricing(model or self._default_model)
         if pricing is None:
             return 0.0
         return (prompt_tokens / 1000 * pricing["prompt"]) + (
@@ -179,40 +206,60 @@ class GeminiClient(LLMClient):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _split_messages(
-        messages: list[LLMMessage],
-    ) -> tuple[str | None, list[LLMMessage]]:
-        """Separate system messages from the conversation."""
-        system_parts: list[str] = []
-        conversation: list[LLMMessage] = []
-        for msg in messages:
-            if msg.role == "system":
-                system_parts.append(msg.content)
-            else:
-                conversation.append(msg)
-        system_instruction = "\n".join(system_parts) if system_parts else None
-        return system_instruction, conversation
+    def _get_model(
+        self,
+        model_name: str,
+        system_instruction: str | None,
+        tools: list[ToolDefinition] | None,
+    ) -> Any:
+        """Return a ``GenerativeModel`` for this model/system/tools combination.
+
+        Building one re-parses the tool schemas into protos, so instances are
+        kept in a small LRU.  Tools are keyed by content: requests rebuild
+        their ``ToolDefinition`` objects, so identity would never hit.
+        """
+        tools_key = tuple((t.name, t.description, t.parameters_json) for t in tools or ())
+        key = (model_name, system_instruction, tools_key)
+        model = self._model_cache.get(key)
+        if model is not None:
+            self._model_cache.move_to_end(key)
+            return model
+
+        model_kwargs: dict[str, Any] = {"model_name": model_name}
+        if system_instruction:
+            model_kwargs["system_instruction"] = system_instruction
+        if tools:
+            model_kwargs["tools"] = self._map_tools(tools)
+        model = genai.GenerativeModel(**model_kwargs)
+
+        self._model_cache[key] = model
+        if len(self._model_cache) > _MODEL_CACHE_SIZE:
+            self._model_cache.popitem(last=False)
+        return model
 
     @staticmethod
-    def _build_contents(messages: list[LLMMessage]) -> list[dict[str, Any]]:
-        """Map internal messages to Gemini content dicts.
+    def _prepare_messages(
+        messages: list[LLMMessage],
+    ) -> tuple[str | None, list[dict[str, Any]]]:
+        """Split system messages out and map the rest to Gemini content dicts in one pass.
 
-        Gemini uses ``user`` and ``model`` roles (not ``assistant``).
+        Roles are translated via ``_ROLE_MAP``; multiple system messages are
+        joined with newlines.
         """
-        role_map = {"user": "user", "assistant": "model", "tool": "user"}
+        system_parts: list[str] = []
         contents: list[dict[str, Any]] = []
+        role_for = _ROLE_MAP.get
         for msg in messages:
-            role = role_map.get(msg.role, "user")
-            parts: list[dict[str, str]] = [{"text": msg.content}]
-            contents.append({"role": role, "parts": parts})
-        return contents
+            role = msg.role
+            if role == "system":
+                system_parts.append(msg.content)
+            else:
+                contents.append({"role": role_for(role, "user"), "parts": [{"text": msg.content}]})
+        return ("\n".join(system_parts) if system_parts else None), contents
 
     @staticmethod
     def _map_tools(tools: list[ToolDefinition]) -> list[Any]:
         """Convert ``ToolDefinition`` objects to Gemini function declarations."""
-        import google.generativeai as genai
-
         declarations = []
         for t in tools:
             declarations.append(
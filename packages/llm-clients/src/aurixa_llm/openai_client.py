@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import os
+import re
 import time
 from collections.abc import AsyncIterator
 from typing import Any
 
+import httpx
 from loguru import logger
 from openai import AsyncOpenAI
 
@@ -36,6 +38,18 @@ _OPENAI_PRICING: dict[str, dict[str, float]] = {
 
 DEFAULT_MODEL = "gpt-4o"
 
+# Pricing keys sorted longest-first: the alternation's match is the longest prefix.
+_PRICING_RE = re.compile(
+    "^(" + "|".join(re.escape(k) for k in sorted(_OPENAI_PRICING, key=len, reverse=True)) + ")"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_pricing(model: str) -> dict[str, float] | None:
+    """Pricing for the longest known key the (possibly versioned) model id starts with."""
+    m = _PRICING_RE.match(model)
+    return _OPENAI_PRICING[m.group(1)] if m else None
+
 
 class OpenAIClient(LLMClient):
     """Async client for OpenAI and any OpenAI-compatible endpoint (e.g. LM Studio).
@@ -45,6 +59,9 @@ class OpenAIClient(LLMClient):
         base_url: Override the API base URL (useful for LM Studio or Azure).
         default_model: Model to use when the request does not specify one.
         timeout: HTTP request timeout in seconds.
+        http_client: Shared ``httpx.AsyncClient`` (connection pool) to send
+            requests through, e.g. the one ``LLMRouter`` is given.  The SDK
+            creates its own when omitted.
     """
 
     def __init__(
@@ -53,6 +70,7 @@ class OpenAIClient(LLMClient):
         base_url: str | None = None,
         default_model: str = DEFAULT_MODEL,
         timeout: float = 120.0,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         self._api_key = api_key or os.getenv("OPENAI_API_KEY", "")
         self._base_url = base_url
@@ -65,6 +83,8 @@ class OpenAIClient(LLMClient):
         }
         if self._base_url:
             client_kwargs["base_url"] = self._base_url
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
 
         self._client = AsyncOpenAI(**client_kwargs)
         self._provider = LLMProvider.LOCAL if self._base_url else LLMProvider.OPENAI
@@ -107,19 +127,10 @@ class OpenAIClient(LLMClient):
 
         tool_calls: list[ToolCall] | None = None
         if choice.message.tool_calls:
-            tool_calls = []
-            for tc in choice.message.tool_calls:
-                try:
-                    arguments = json.loads(tc.function.arguments)
-                except (json.JSONDecodeError, TypeError):
-                    arguments = {"raw": tc.function.arguments}
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.id,
-                        name=tc.function.name,
-                        arguments=arguments,
-                    )
-                )
+            tool_calls = [
+                ToolCall.from_json_arguments(tc.id, tc.function.name, tc.function.arguments)
+                for tc in choice.message.tool_calls
+            ]
 
         usage = response.usage
         prompt_tokens = usage.prompt_tokens if usage else 0
@@ -136,12 +147,12 @@ class OpenAIClient(LLMClient):
             estimated_cost,
         )
 
-        return LLMResponse(
+        return LLMResponse.from_trusted(
             content=content,
             model=response.model,
             provider=self._provider,
             tool_calls=tool_calls,
-            usage=TokenUsage(
+            usage=TokenUsage.from_trusted(
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
                 total_tokens=total_tokens,
@@ -190,14 +201,7 @@ class OpenAIClient(LLMClient):
         model: str | None = None,
     ) -> float:
         """Return estimated USD cost based on known pricing tables."""
-        model = model or self._default_model
-        # Find the best matching pricing entry (prefix match for versioned models).
-        pricing = _OPENAI_PRICING.get(model)
-        if pricing is None:
-            for key in _OPENAI_PRICING:
-                if model.startswith(key):
-                    pricing = _OPENAI_PRICING[key]
-                    break
+        pricing = _resolve_pricing(model or self._default_model)
         if pricing is None:
             return 0.0
         return (prompt_tokens / 1000 * pricing["prompt"]) + (
@@ -210,10 +214,14 @@ class OpenAIClient(LLMClient):
 
     @staticmethod
     def _map_messages(messages: list) -> list[dict[str, Any]]:
-        """Convert ``LLMMessage`` objects to the OpenAI dict format."""
+        """Convert ``LLMMessage`` objects to the OpenAI dict format (memoised per message)."""
         result: list[dict[str, Any]] = []
         for msg in messages:
-            entry: dict[str, Any] = {"role": msg.role, "content": msg.content}
+            entry = msg._wire_cache.get("openai")
+            if entry is not None:
+                result.append(entry)
+                continue
+            entry = {"role": msg.role, "content": msg.content}
             if msg.tool_calls:
                 entry["tool_calls"] = [
                     {
@@ -221,13 +229,14 @@ class OpenAIClient(LLMClient):
                         "type": "function",
                         "function": {
                             "name": tc.name,
-                            "arguments": json.dumps(tc.arguments),
+                            "arguments": tc.arguments_json,
                         },
                     }
                     for tc in msg.tool_calls
                 ]
             if msg.tool_call_id:
                 entry["tool_call_id"] = msg.tool_call_id
+            msg._wire_cache["openai"] = entry
             result.append(entry)
         return result
 
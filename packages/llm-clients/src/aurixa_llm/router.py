@@ -2,18 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib
+import importlib.util
 import os
-from collections.abc import AsyncIterator
-from typing import Any
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
-from .anthropic_client import AnthropicClient
 from .base import LLMClient
-from .gemini_client import GeminiClient
-from .openai_client import OpenAIClient
 from .types import LLMProvider, LLMRequest, LLMResponse
 
+if TYPE_CHECKING:
+    import httpx
+
+# Provider -> (module, class, SDK module).  Provider SDKs are heavy to import,
+# so each module is loaded only when its client is first used.
+_PROVIDER_CLASSES: dict[LLMProvider, tuple[str, str, str]] = {
+    LLMProvider.LOCAL: (".openai_client", "OpenAIClient", "openai"),
+    LLMProvider.OPENAI: (".openai_client", "OpenAIClient", "openai"),
+    LLMProvider.ANTHROPIC: (".anthropic_client", "AnthropicClient", "anthropic"),
+    LLMProvider.GEMINI: (".gemini_client", "GeminiClient", "google.generativeai"),
+}
+
+
+def _client_class(provider: LLMProvider) -> type[LLMClient]:
+    module, name, _sdk = _PROVIDER_CLASSES[provider]
+    return getattr(importlib.import_module(module, __package__), name)
+
+
+def _sdk_installed(provider: LLMProvider) -> bool:
+    """Whether the provider's SDK can be imported, checked without importing it."""
+    try:
+        return importlib.util.find_spec(_PROVIDER_CLASSES[provider][2]) is not None
+    except ModuleNotFoundError:  # parent package (e.g. ``google``) missing
+        return False
+
+
+# generate_batched() coalescing window and batch cap.
+BATCH_MAX_WAIT_MS = 5
+BATCH_MAX_SIZE = 16
+
+# Circuit breaker: after N consecutive failures a provider is skipped by the
+# fallback chain for min(BREAKER_MAX_COOLDOWN_SEC, 2**N) seconds.
+BREAKER_MAX_COOLDOWN_SEC = 60.0
+
+# (request, explicit provider, caller's future) queued by generate_batched().
+_BatchItem = tuple[LLMRequest, LLMProvider | None, "asyncio.Future[LLMResponse]"]
+_Pending = tuple[LLMRequest, "asyncio.Future[LLMResponse]"]
+
 
 class LLMRouter:
     """Routes LLM requests to configured providers with fallback support.
@@ -22,11 +62,33 @@ class LLMRouter:
     which provider API keys are available and builds an ordered fallback
     chain automatically.  Providers can also be registered (or hot-swapped)
     at runtime via :meth:`register`.
+
+    Args:
+        http_client: Optional shared ``httpx.AsyncClient`` handed to every
+            provider SDK, so all providers draw from one connection pool
+            (HTTP/2 when the client enables it).  The caller owns and closes it.
+        hedge_delay: Seconds to wait on a provider before also dispatching the
+            next one in the fallback chain (first success wins).  ``None``
+            keeps strict sequential fallback.  Defaults to
+            ``LLM_HEDGE_DELAY_SEC`` when set.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        hedge_delay: float | None = None,
+    ) -> None:
+        self._http_client = http_client
+        if hedge_delay is None and os.getenv("LLM_HEDGE_DELAY_SEC"):
+            hedge_delay = float(os.environ["LLM_HEDGE_DELAY_SEC"])
+        self._hedge_delay = hedge_delay
         self._clients: dict[LLMProvider, LLMClient] = {}
+        self._factories: dict[LLMProvider, Callable[[], LLMClient]] = {}
+        self._breaker: dict[LLMProvider, dict[str, float]] = {}
         self._fallback_order: list[LLMProvider] = []
+        self._batch_queue: asyncio.Queue[_BatchItem] | None = None
+        self._batcher_task: asyncio.Task[None] | None = None
+        self._batch_tasks: set[asyncio.Task[Any]] = set()  # strong refs until done
         self._initialize_clients()
 
     # ------------------------------------------------------------------
@@ -34,44 +96,98 @@ class LLMRouter:
     # ------------------------------------------------------------------
 
     def _initialize_clients(self) -> None:
-        """Auto-detect providers. Local (LM Studio) first for cost savings; cloud as selectable options."""
+        """Auto-detect providers. Local (LM Studio) first for cost savings; cloud as selectable options.
+
+        Clients (and their SDK imports) are built on first use; see :meth:`_client`.
+        """
         # 1. Local LM Studio - primary for dev (cost-free)
         # LM Studio serves at http://127.0.0.1:1234; OpenAI-compatible API is at /v1
         raw = os.getenv("LM_STUDIO_BASE_URL", "http://127.0.0.1:1234").rstrip("/")
         lm_studio_url = f"{raw}/v1" if "/v1" not in raw else raw
-        try:
-            self._clients[LLMProvider.LOCAL] = OpenAIClient(
-                base_url=lm_studio_url, api_key="not-needed"
-            )
-            self._fallback_order.append(LLMProvider.LOCAL)
-        except Exception as e:
-            logger.warning("LM Studio not available: {}", e)
+        self._defer(
+            LLMProvider.LOCAL,
+            base_url=lm_studio_url, api_key="not-needed", http_client=self._http_client,
+        )
 
         # 2. Cloud providers - selectable (use placeholder keys if unset; calls fail until real key configured)
-        try:
-            key = os.getenv("OPENAI_API_KEY") or "sk-placeholder"
-            self._clients[LLMProvider.OPENAI] = OpenAIClient(api_key=key)
-            self._fallback_order.append(LLMProvider.OPENAI)
-        except Exception as e:
-            logger.warning("OpenAI provider not available: {}", e)
-        try:
-            key = os.getenv("ANTHROPIC_API_KEY") or "sk-ant-placeholder"
-            self._clients[LLMProvider.ANTHROPIC] = AnthropicClient(api_key=key)
-            self._fallback_order.append(LLMProvider.ANTHROPIC)
-        except Exception as e:
-            logger.warning("Anthropic provider not available: {}", e)
-        try:
-            key = os.getenv("GOOGLE_AI_API_KEY") or "placeholder"
-            self._clients[LLMProvider.GEMINI] = GeminiClient(api_key=key)
-            self._fallback_order.append(LLMProvider.GEMINI)
-        except Exception as e:
-            logger.warning("Gemini provider not available: {}", e)
+        key = os.getenv("OPENAI_API_KEY") or "sk-placeholder"
+        self._defer(LLMProvider.OPENAI, api_key=key, http_client=self._http_client)
+        key = os.getenv("ANTHROPIC_API_KEY") or "sk-ant-placeholder"
+        self._defer(LLMProvider.ANTHROPIC, api_key=key, http_client=self._http_client)
+        key = os.getenv("GOOGLE_AI_API_KEY") or "placeholder"
+        self._defer(LLMProvider.GEMINI, api_key=key)
 
         logger.info(
             "LLM Router initialized with providers: {}",
             [p.value for p in self._fallback_order],
         )
 
+    def _defer(self, provider: LLMProvider, **kwargs: Any) -> None:
+        """Add ``provider`` to the fallback chain, constructing its client lazily.
+
+        Providers whose SDK is not installed are left out of the chain.
+        """
+        if not _sdk_installed(provider):
+            logger.warning("{} provider not available: SDK not installed", provider.value)
+            return
+        self._factories[provider] = lambda: _client_class(provider)(**kwargs)
+        self._fallback_order.append(provider)
+
+    def _client(self, provider: LLMProvider) -> LLMClient | None:
+        """Return the provider's client, importing and constructing it on first use.
+
+        Returns ``None`` if construction fails; the provider is then dropped
+        from the chain, the same outcome as a failed eager init.
+        """
+        client = self._clients.get(provider)
+        if client is None:
+            factory = self._factories.get(provider)
+            if factory is None:
+                return None
+            try:
+                client = factory()
+            except Exception as exc:
+                logger.warning("{} provider not available: {}", provider.value, exc)
+                self.unregister(provider)
+                return None
+            self._clients[provider] = client
+            del self._factories[provider]
+        return client
+
+    def _require_client(self, provider: LLMProvider) -> LLMClient:
+        client = self._client(provider)
+        if client is None:
+            raise RuntimeError(f"{provider.value} provider not available")
+        return client
+
+    def _available(self, order: list[LLMProvider]) -> list[LLMProvider]:
+        """``order`` minus providers whose breaker is open.
+
+        If every breaker is open, the full list is returned so requests still
+        probe for recovery instead of failing without a single attempt.
+        """
+        now = time.monotonic()
+        closed = [p for p in order if self._breaker.get(p, {}).get("open_until", 0.0) <= now]
+        return closed or list(order)
+
+    def _record_success(self, provider: LLMProvider) -> None:
+        self._breaker.pop(provider, None)
+
+    def _record_failure(self, provider: LLMProvider) -> None:
+        state = self._breaker.setdefault(provider, {"failures": 0, "open_until": 0.0})
+        state["failures"] += 1
+        cooldown = min(BREAKER_MAX_COOLDOWN_SEC, 2 ** state["failures"])
+        state["open_until"] = time.monotonic() + cooldown
+
+    async def _generate_one(self, provider: LLMProvider, request: LLMRequest) -> LLMResponse:
+        return await self._require_client(provider).generate(request)
+
+    async def _health_one(self, provider: LLMProvider) -> bool:
+        # Builds never-used clients (still lazily, on first probe); one that
+        # fails to construct is unregistered and reported unhealthy.
+        client = self._client(provider)
+        return client is not None and await client.health_check()
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -88,6 +204,7 @@ class LLMRouter:
         new it is appended to the end of the fallback chain.
         """
         self._clients[provider] = client
+        self._factories.pop(provider, None)
         if provider not in self._fallback_order:
             self._fallback_order.append(provider)
         logger.info("Registered provider: {}", provider.value)
@@ -95,6 +212,8 @@ class LLMRouter:
     def unregister(self, provider: LLMProvider) -> None:
         """Remove a provider from the router entirely."""
         self._clients.pop(provider, None)
+        self._factories.pop(provider, None)
+        self._breaker.pop(provider, None)
         if provider in self._fallback_order:
             self._fallback_order.remove(provider)
         logger.info("Unregistered provider: {}", provider.value)
@@ -109,7 +228,8 @@ class LLMRouter:
         Args:
             request: The generation request.
             provider: Optional explicit provider.  When ``None`` the router
-                iterates through the fallback chain until one succeeds.
+                iterates through the fallback chain until one succeeds,
+                skipping providers whose circuit breaker is open.
 
         Returns:
             The first successful ``LLMResponse``.
@@ -117,8 +237,11 @@ class LLMRouter:
         Raises:
             RuntimeError: If all providers fail (or none are registered).
         """
-        if provider and provider in self._clients:
-            return await self._clients[provider].generate(request)
+        if provider and provider in self._fallback_order:
+            client = self._client(provider)
+            if client is not None:
+                return await client.generate(request)
+            # Construction failed and it was unregistered: use the chain.
 
         if not self._fallback_order:
             raise RuntimeError(
@@ -127,17 +250,190 @@ class LLMRouter:
                 "GOOGLE_AI_API_KEY, or LM_STUDIO_BASE_URL."
             )
 
-        last_error: Exception | None = None
-        for p in self._fallback_order:
+        if self._hedge_delay is not None:
+            return await self._generate_hedged(request, self._hedge_delay)
+
+        return await self._generate_sequential(request, self._fallback_order)
+
+    async def _generate_sequential(
+        self,
+        request: LLMRequest,
+        order: list[LLMProvider],
+        last_error: BaseException | None = None,
+    ) -> LLMResponse:
+        """Try each provider in ``order`` (open breakers skipped) until one succeeds."""
+        for p in self._available(order):
+            client = self._client(p)
+            if client is None:
+                continue
             try:
-                return await self._clients[p].generate(request)
+                response = await client.generate(request)
             except Exception as exc:
                 logger.warning("Provider {} failed: {}", p.value, exc)
+                self._record_failure(p)
                 last_error = exc
                 continue
+            self._record_success(p)
+            return response
+
+        raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
+
+    async def _generate_hedged(self, request: LLMRequest, delay: float) -> LLMResponse:
+        """Walk the fallback chain with hedging.
+
+        The next provider starts as soon as the current one fails, or once it
+        has been running for ``delay`` seconds without answering.  The first
+        successful response wins and the other in-flight requests are cancelled.
+        """
+        remaining = iter(self._available(self._fallback_order))
+        in_flight: dict[asyncio.Task[LLMResponse], LLMProvider] = {}
+
+        def launch_next() -> None:
+            p = next(remaining, None)
+            if p is not None:
+                in_flight[asyncio.create_task(self._generate_one(p, request))] = p
+
+        last_error: Exception | None = None
+        launch_next()
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    launch_next()  # slow provider: hedge with the next one
+                    continue
+                for task in done:
+                    p = in_flight.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        self._record_success(p)
+                        return task.result()
+                    logger.warning("Provider {} failed: {}", p.value, exc)
+                    self._record_failure(p)
+                    last_error = exc
+                    launch_next()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
         raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
 
+    async def generate_batched(
+        self,
+        request: LLMRequest,
+        provider: LLMProvider | None = None,
+    ) -> LLMResponse:
+        """Like :meth:`generate`, but coalesces bursts of concurrent requests.
+
+        Requests arriving within ``BATCH_MAX_WAIT_MS`` of each other (up to
+        ``BATCH_MAX_SIZE``) are grouped by ``(provider, model)`` and sent
+        through :meth:`LLMClient.generate_many`.  Requests without an explicit
+        provider go to the head of the fallback chain; any that fail there
+        continue down the rest of the chain individually.
+        """
+        if not self._fallback_order:
+            return await self.generate(request, provider)
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batch_queue = asyncio.Queue()
+            self._batcher_task = asyncio.create_task(self._batcher(self._batch_queue))
+        future: asyncio.Future[LLMResponse] = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((request, provider, future))
+        return await future
+
+    async def _batcher(self, queue: asyncio.Queue[_BatchItem]) -> None:
+        """Drain the batch queue until cancelled, flushing on window expiry or size cap."""
+        loop = asyncio.get_running_loop()
+        batch: list[_BatchItem] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + BATCH_MAX_WAIT_MS / 1000
+                while len(batch) < BATCH_MAX_SIZE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except TimeoutError:
+                        break
+
+                groups: dict[tuple[LLMProvider | None, str | None], list[_Pending]] = {}
+                for request, provider, future in batch:
+                    explicit = provider if provider and self._client(provider) is not None else None
+                    groups.setdefault((explicit, request.model), []).append((request, future))
+                for (provider, _model), items in groups.items():
+                    self._spawn(self._flush_batch(provider, items))
+                batch = []
+        except asyncio.CancelledError:
+            # Shutdown: release callers still collected in the open window.
+            for _, _, future in batch:
+                future.cancel()
+            raise
+
+    async def _flush_batch(
+        self,
+        provider: LLMProvider | None,
+        items: list[_Pending],
+    ) -> None:
+        """Send one coalesced group and resolve each caller's future."""
+        order = self._fallback_order
+        target = provider or next(iter(self._available(order)), None)
+        try:
+            if target is None:
+                raise RuntimeError("No LLM providers configured.")
+            results = await self._require_client(target).generate_many([r for r, _ in items])
+        except asyncio.CancelledError:
+            for _, future in items:
+                future.cancel()
+            raise
+        except Exception as exc:
+            results = [exc] * len(items)
+
+        if target in self._fallback_order:
+            if any(isinstance(r, BaseException) for r in results):
+                self._record_failure(target)
+            else:
+                self._record_success(target)
+
+        for (request, future), result in zip(items, results):
+            if future.done():
+                continue
+            if not isinstance(result, BaseException):
+                future.set_result(result)
+            elif provider is not None or target is None:
+                future.set_exception(result)
+            else:
+                logger.warning("Provider {} failed: {}", target.value, result)
+                rest = [p for p in order if p != target]
+                task = self._spawn(self._generate_sequential(request, rest, result))
+                task.add_done_callback(functools.partial(_chain_future, future))
+
+    def _spawn(self, coro: Any) -> asyncio.Task[Any]:
+        """Start a background batch task, keeping it referenced until it finishes."""
+        task = asyncio.create_task(coro)
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+        return task
+
+    async def aclose(self) -> None:
+        """Stop the :meth:`generate_batched` worker and cancel its in-flight batches.
+
+        Callers still waiting on a batched request get ``CancelledError``.  The
+        shared ``http_client`` is left to its owner to close.
+        """
+        tasks = [t for t in (self._batcher_task, *self._batch_tasks) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._batch_queue is not None:
+            while not self._batch_queue.empty():
+                _, _, future = self._batch_queue.get_nowait()
+                future.cancel()
+        self._batch_queue = None
+        self._batcher_task = None
+
     async def generate_stream(
         self,
         request: LLMRequest,
@@ -145,34 +441,57 @@ class LLMRouter:
     ) -> AsyncIterator[str]:
         """Stream completion tokens. Uses specified provider or fallback chain.
         Providers that do not implement generate_stream yield the full content once."""
-        if provider and provider in self._clients:
-            async for chunk in self._clients[provider].generate_stream(request):
+        client = self._client(provider) if provider and provider in self._fallback_order else None
+        if client is not None:
+            async for chunk in client.generate_stream(request):
                 yield chunk
             return
         if not self._fallback_order:
             raise RuntimeError("No LLM providers configured.")
         last_error: Exception | None = None
-        for p in self._fallback_order:
+        for p in self._available(self._fallback_order):
+            client = self._client(p)
+            if client is None:
+                continue
             try:
-                async for chunk in self._clients[p].generate_stream(request):
+                async for chunk in client.generate_stream(request):
                     yield chunk
-                return
             except Exception as exc:
                 logger.warning("Provider {} stream failed: {}", p.value, exc)
+                self._record_failure(p)
                 last_error = exc
                 continue
+            self._record_success(p)
+            return
         raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
 
     async def health(self) -> dict[str, bool]:
         """Run health checks across all registered providers.
 
+        Clients not built yet are constructed for the probe.
+
         Returns:
             Mapping of provider name to health status.
         """
-        results: dict[str, bool] = {}
-        for provider, client in self._clients.items():
-            try:
-                results[provider.value] = await client.health_check()
-            except Exception:
-                results[provider.value] = False
-        return results
+        # Probes are independent network calls: run them concurrently.
+        providers = list(self._fallback_order)
+        outcomes = await asyncio.gather(
+            *(self._health_one(p) for p in providers),
+            return_exceptions=True,
+        )
+        return {
+            provider.value: outcome is True
+            for provider, outcome in zip(providers, outcomes)
+        }
+
+
+def _chain_future(future: asyncio.Future[LLMResponse], task: asyncio.Task[LLMResponse]) -> None:
+    """Copy a finished task's outcome onto a caller's future (unless cancelled)."""
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
@@ -3,9 +3,42 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from collections.abc import Mapping
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _FrozenModel(BaseModel):
+    """Base for the immutable value objects below.
+
+    Frozen (no per-assignment validation); unknown keys are ignored, as the
+    llm-router API accepts these types from clients verbatim.  Values
+    derived from the fields are memoised with ``cached_property``.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """Build an instance without validation.
+
+        Only for already-typed values, e.g. fields read off a provider SDK's
+        typed response objects.  Anything user-supplied must go through the
+        normal constructor.
+        """
+        return cls.model_construct(**data)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model; with ``update``, memoised values from the old fields are dropped."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            fields = type(self).model_fields
+            for key in [k for k in copied.__dict__ if k not in fields]:
+                del copied.__dict__[key]
+        return copied
 
 
 class LLMProvider(str, Enum):
@@ -17,23 +50,53 @@ class LLMProvider(str, Enum):
     LOCAL = "local"  # LM Studio / OpenAI-compatible
 
 
-class ToolDefinition(BaseModel):
+class ToolDefinition(_FrozenModel):
     """Schema definition for a tool that can be invoked by the LLM."""
 
     name: str
     description: str
     parameters: dict[str, Any]
 
+    @cached_property
+    def parameters_json(self) -> bytes:
+        """``parameters`` as canonical (key-sorted) JSON, encoded once per definition."""
+        return orjson.dumps(self.parameters, option=orjson.OPT_SORT_KEYS)
+
 
-class ToolCall(BaseModel):
+class ToolCall(_FrozenModel):
     """A tool invocation requested by the LLM."""
 
     id: str
     name: str
     arguments: dict[str, Any]
 
-
-class LLMMessage(BaseModel):
+    @classmethod
+    def from_json_arguments(cls, id: str, name: str, raw: str) -> ToolCall:
+        """Build from JSON-encoded arguments (OpenAI style), keeping the raw text
+        as ``arguments_json``.
+
+        Non-object or malformed payloads are wrapped as ``{"raw": raw}``.
+        """
+        try:
+            arguments = orjson.loads(raw)
+        except (orjson.JSONDecodeError, TypeError):
+            arguments = None
+        if not isinstance(arguments, dict):
+            return cls.from_trusted(id=id, name=name, arguments={"raw": raw})
+        call = cls.from_trusted(id=id, name=name, arguments=arguments)
+        # Pre-fill the cached_property: ignored by __eq__ and dropped by
+        # model_copy(update=...), like any other memoised value.
+        call.__dict__["arguments_json"] = raw
+        return call
+
+    @cached_property
+    def arguments_json(self) -> str:
+        """``arguments`` as a JSON string: the provider's original text if
+        known, else encoded once per tool call."""
+        return orjson.dumps(self.arguments).decode()
+
+
+class LLMMessage(_FrozenModel):
     """A single message in a conversation."""
 
     role: str  # system, user, assistant, tool
@@ -41,8 +104,14 @@ class LLMMessage(BaseModel):
     tool_calls: list[ToolCall] | None = None
     tool_call_id: str | None = None
 
+    @cached_property
+    def _wire_cache(self) -> dict[str, dict[str, Any]]:
+        """Provider wire-format dicts, keyed by provider.  Retries and provider
+        fallback re-send the same message objects, so each is mapped once."""
+        return {}
+
 
-class TokenUsage(BaseModel):
+class TokenUsage(_FrozenModel):
     """Token consumption and estimated cost for a single request."""
 
     prompt_tokens: int
@@ -51,7 +120,7 @@ class TokenUsage(BaseModel):
     estimated_cost_usd: float | None = None
 
 
-class LLMRequest(BaseModel):
+class LLMRequest(_FrozenModel):
     """Parameters for an LLM generation request."""
 
     messages: list[LLMMessage]
@@ -63,7 +132,7 @@ class LLMRequest(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
-class LLMResponse(BaseModel):
+class LLMResponse(_FrozenModel):
     """Result returned by an LLM provider after generation."""
 
     content: str
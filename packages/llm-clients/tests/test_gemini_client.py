@@ -0,0 +1,23 @@
+"""Tests for the Gemini client helpers."""
+
+import os
+
+import pytest
+
+from aurixa_llm import gemini_client
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_gets_its_own_tool_call_prefix() -> None:
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child
+        os.write(write_fd, gemini_client._TC_PREFIX.encode())
+        os._exit(0)
+    os.close(write_fd)
+    child_prefix = os.read(read_fd, 256).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    assert child_prefix.startswith(f"gem-{pid}-")
+    assert child_prefix != gemini_client._TC_PREFIX
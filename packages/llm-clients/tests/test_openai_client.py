@@ -0,0 +1,26 @@
+"""Tests for the OpenAI wire-format mapping."""
+
+from aurixa_llm.openai_client import OpenAIClient
+from aurixa_llm.types import LLMMessage
+
+
+def test_map_messages_reflects_model_copy_update() -> None:
+    msg = LLMMessage(role="user", content="old")
+    assert OpenAIClient._map_messages([msg]) == [{"role": "user", "content": "old"}]
+
+    edited = msg.model_copy(update={"content": "new"})
+    assert OpenAIClient._map_messages([edited]) == [{"role": "user", "content": "new"}]
+    assert OpenAIClient._map_messages([msg]) == [{"role": "user", "content": "old"}]
+
+
+def test_mapped_message_still_equals_unmapped_copy() -> None:
+    msg = LLMMessage(role="user", content="hi")
+    OpenAIClient._map_messages([msg])
+    assert msg == LLMMessage(role="user", content="hi")
+
+
+def test_estimate_cost_uses_longest_pricing_prefix() -> None:
+    client = OpenAIClient(api_key="sk-test")
+    assert client.estimate_cost(1000, 1000, "gpt-4o") == 0.0025 + 0.01
+    assert client.estimate_cost(1000, 1000, "gpt-4o-mini-2024-07-18") == 0.00015 + 0.0006
+    assert client.estimate_cost(1000, 1000, "unknown-model") == 0.0
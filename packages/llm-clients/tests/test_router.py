@@ -0,0 +1,125 @@
+"""Tests for provider routing and fallback."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from aurixa_llm import router as router_module
+from aurixa_llm.base import LLMClient
+from aurixa_llm.router import LLMRouter
+from aurixa_llm.types import LLMMessage, LLMProvider, LLMRequest, LLMResponse, TokenUsage
+
+
+class FakeClient(LLMClient):
+    """Answers every request with its provider name."""
+
+    def __init__(self, provider: LLMProvider, **_: object) -> None:
+        self.provider = provider
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        return LLMResponse(
+            content=self.provider.value,
+            model=request.model or "fake",
+            provider=self.provider,
+            usage=TokenUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+            latency_ms=0.0,
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+    def estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        return 0.0
+
+
+@pytest.fixture
+def router(monkeypatch: pytest.MonkeyPatch) -> LLMRouter:
+    """Router over fake clients; the OpenAI client fails to construct."""
+    built: list[LLMProvider] = []
+
+    def client_class(provider: LLMProvider):
+        def build(**kwargs: object) -> FakeClient:
+            if provider is LLMProvider.OPENAI:
+                raise ImportError("openai is not installed")
+            built.append(provider)
+            return FakeClient(provider, **kwargs)
+
+        return build
+
+    monkeypatch.setattr(router_module, "_client_class", client_class)
+    monkeypatch.setattr(router_module, "_sdk_installed", lambda provider: True)
+    r = LLMRouter()
+    r.built = built  # type: ignore[attr-defined]
+    return r
+
+
+def _request() -> LLMRequest:
+    return LLMRequest(messages=[LLMMessage(role="user", content="hi")])
+
+
+@pytest.mark.asyncio
+async def test_explicit_provider_that_fails_to_build_falls_back(router: LLMRouter) -> None:
+    response = await router.generate(_request(), provider=LLMProvider.OPENAI)
+    assert response.provider is LLMProvider.LOCAL
+    assert LLMProvider.OPENAI not in router.providers
+
+
+@pytest.mark.asyncio
+async def test_stream_explicit_provider_that_fails_to_build_falls_back(router: LLMRouter) -> None:
+    chunks = [c async for c in router.generate_stream(_request(), provider=LLMProvider.OPENAI)]
+    assert chunks == [LLMProvider.LOCAL.value]
+
+
+@pytest.mark.asyncio
+async def test_health_probes_unused_providers(router: LLMRouter) -> None:
+    assert router.built == []  # type: ignore[attr-defined]
+    health = await router.health()
+    assert health == {"local": True, "openai": False, "anthropic": True, "gemini": True}
+    assert LLMProvider.OPENAI not in router.providers
+
+
+class CountingClient(FakeClient):
+    """Records each batch handed to ``generate_many``."""
+
+    def __init__(self, provider: LLMProvider) -> None:
+        super().__init__(provider)
+        self.batches: list[int] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def generate_many(self, requests: list[LLMRequest]) -> list[LLMResponse | BaseException]:
+        self.batches.append(len(requests))
+        await self.release.wait()
+        return await super().generate_many(requests)
+
+
+@pytest.mark.asyncio
+async def test_generate_batched_coalesces_concurrent_requests(router: LLMRouter) -> None:
+    client = CountingClient(LLMProvider.LOCAL)
+    router.register(LLMProvider.LOCAL, client)
+
+    responses = await asyncio.gather(*(router.generate_batched(_request()) for _ in range(3)))
+
+    assert [r.provider for r in responses] == [LLMProvider.LOCAL] * 3
+    assert client.batches == [3]
+    await router.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_cancels_worker_and_in_flight_batches(router: LLMRouter) -> None:
+    client = CountingClient(LLMProvider.LOCAL)
+    client.release.clear()
+    router.register(LLMProvider.LOCAL, client)
+
+    caller = asyncio.create_task(router.generate_batched(_request()))
+    while not client.batches:
+        await asyncio.sleep(0.001)
+    batcher = router._batcher_task
+    await router.aclose()
+
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+    assert batcher is not None and batcher.done()
+    assert not router._batch_tasks
@@ -0,0 +1,21 @@
+"""Tests for the LLM value types."""
+
+from aurixa_llm.types import LLMMessage, ToolCall
+
+
+def test_tool_call_copy_reencodes_updated_arguments() -> None:
+    call = ToolCall.from_json_arguments("call_1", "lookup", '{"q": "a"}')
+    assert call.arguments_json == '{"q": "a"}'
+
+    edited = call.model_copy(update={"arguments": {"q": "b"}})
+    assert edited.arguments_json == '{"q":"b"}'
+
+
+def test_tool_call_equality_ignores_raw_arguments() -> None:
+    parsed = ToolCall.from_json_arguments("call_1", "lookup", '{"q": "a"}')
+    assert parsed == ToolCall(id="call_1", name="lookup", arguments={"q": "a"})
+
+
+def test_message_ignores_unknown_keys() -> None:
+    msg = LLMMessage.model_validate({"role": "user", "content": "hi", "name": "alice"})
+    assert msg == LLMMessage(role="user", content="hi")
@@ -10,16 +10,106 @@ Usage:
     logger = create_logger("market-data")
     logger.info("Server started", port=4001)
     logger.bind(correlation_id="abc-123").info("Processing request")
+
+    # Guard expensive arguments; loguru only defers formatting, not evaluation.
+    if is_enabled_for("DEBUG"):
+        logger.debug("payload={}", expensive_dump())
 """
 
-import sys
+from __future__ import annotations
+
+import gzip
 import os
+import shutil
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
 from loguru import logger as _logger
 
+try:
+    import orjson
+
+    # OPT_NON_STR_KEYS: bound extras may nest dicts keyed by ints/UUIDs etc.
+    def _dumps(obj: dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:  # stdlib fallback
+    import json
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return json.dumps(obj, default=str, separators=(",", ":"))
+
+if TYPE_CHECKING:
+    from loguru import Logger, Record
+
+# One bound logger per service; sinks are installed once per process/service.
+_LOGGER_CACHE: dict[str, Logger] = {}
+_initialized = False
+_INIT_LOCK = threading.Lock()
+_min_level_no = 0  # LOG_LEVEL severity, resolved when the sinks are installed
+
+
+def _add_json(record: Record) -> None:
+    """Patcher: serialise the record once into ``record["json"]``.
+
+    One ``_dumps`` call (orjson when installed) instead of template
+    interpolation, so messages and extras with quotes or newlines still
+    produce valid JSON.  Bound extras become top-level keys; tracebacks go
+    in an ``exception`` field to keep one object per line.
+    """
+    entry = {
+        "timestamp": record["time"].isoformat(timespec="milliseconds"),
+        "level": record["level"].name,
+        "message": record["message"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        entry["exception"] = "".join(traceback.format_exception(*record["exception"]))
+    record["json"] = _dumps(entry)
+
+
+def _json_format(record: Record) -> str:
+    """JSON structured format for production (rendered by ``_add_json``).
+
+    A callable format, so Loguru does not append the raw traceback after
+    the JSON line.
+    """
+    return "{json}\n"
+
+
+# Rotated logs are gzipped off the logging thread.  Created at import so sinks
+# rotating concurrently share it; its single worker thread starts on first use.
+_compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-gzip")
 
-def create_logger(service: str):
+
+def _gzip_file(path: str) -> None:
+    with open(path, "rb") as src, gzip.open(f"{path}.gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
+
+
+def _compress_in_background(path: str) -> None:
+    """Loguru ``compression`` hook: queue gzip of the rotated file and return."""
+    _compressor.submit(_gzip_file, path)
+
+
+# Human-readable for dev
+_DEV_FORMAT = (
+    "<green>{time:HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{extra[service]}</cyan> | "
+    "<level>{message}</level> | {extra}"
+)
+
+
+def create_logger(service: str) -> Logger:
     """Create a configured Loguru logger for a service.
 
+    Repeated calls for the same service return the cached logger; the stdout
+    sink is shared and each service gets exactly one rotating file sink.
+
     Parameters
     ----------
     service:
@@ -32,40 +122,65 @@ def create_logger(service: str):
     NODE_ENV    : ``development`` for human-readable output,
                   anything else for JSON structured output.
     """
-    _logger.remove()  # Remove default handler
-
-    log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
-    log_dir = os.getenv("LOG_DIR", "logs")
-
-    # JSON structured format for production
-    json_format = (
-        '{{"timestamp":"{time:YYYY-MM-DDTHH:mm:ss.SSS}","level":"{level}",'
-        '"service":"' + service + '","message":"{message}",{extra}}}'
-    )
-
-    # Human-readable for dev
-    dev_format = (
-        "<green>{time:HH:mm:ss.SSS}</green> | "
-        "<level>{level: <8}</level> | "
-        f"<cyan>{service}</cyan> | "
-        "<level>{message}</level> | {extra}"
-    )
-
-    env = os.getenv("NODE_ENV", "development")
-    fmt = dev_format if env == "development" else json_format
-
-    # STDOUT
-    _logger.add(sys.stdout, format=fmt, level=log_level, colorize=(env == "development"))
-
-    # Rotating file
-    os.makedirs(log_dir, exist_ok=True)
-    _logger.add(
-        f"{log_dir}/{service}.log",
-        format=json_format,
-        level=log_level,
-        rotation="50 MB",
-        retention="7 days",
-        compression="gz",
-    )
-
-    return _logger.bind(service=service)
+    global _initialized, _min_level_no
+
+    cached = _LOGGER_CACHE.get(service)
+    if cached is not None:
+        return cached
+
+    # Double-checked: the unlocked lookup above is the hot path; sink setup
+    # runs under the lock so concurrent first calls cannot double-install.
+    with _INIT_LOCK:
+        cached = _LOGGER_CACHE.get(service)
+        if cached is not None:
+            return cached
+
+        log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
+        log_dir = os.getenv("LOG_DIR", "logs")
+
+        if not _initialized:
+            _logger.remove()  # Remove default handler
+            # Records logged without a bound service still render.
+            _logger.configure(extra={"service": "-"}, patcher=_add_json)
+
+            env = os.getenv("NODE_ENV", "development")
+            fmt = _DEV_FORMAT if env == "development" else _json_format
+
+            # STDOUT, written by Loguru's worker thread so producers never
+            # contend on the stream (the file sinks below are enqueued too).
+            _logger.add(
+                sys.stdout,
+                format=fmt,
+                level=log_level,
+                colorize=(env == "development"),
+                enqueue=True,
+            )
+            _min_level_no = _logger.level(log_level).no
+            _initialized = True
+
+        # Rotating file, scoped to this service's records.  enqueue=True moves
+        # writes and rotation onto Loguru's worker thread; a 64 KiB buffer turns
+        # per-record writes into one syscall per block.
+        os.makedirs(log_dir, exist_ok=True)
+        _logger.add(
+            f"{log_dir}/{service}.log",
+            format=_json_format,
+            level=log_level,
+            rotation="50 MB",
+            retention="7 days",
+            compression=_compress_in_background,
+            enqueue=True,
+            buffering=64 * 1024,
+            # Unbound records (plain ``loguru.logger``, e.g. library code) carry
+            # service "-" and go to every service file, as before the filter.
+            filter=lambda record, s=service: record["extra"].get("service") in (s, "-"),
+        )
+
+        bound = _logger.bind(service=service)
+        _LOGGER_CACHE[service] = bound
+        return bound
+
+
+def is_enabled_for(level: str) -> bool:
+    """Whether a record at ``level`` would pass the configured ``LOG_LEVEL``."""
+    return _logger.level(level).no >= _min_level_no
@@ -0,0 +1,31 @@
+"""Tests for the shared Python service logger."""
+
+import orjson
+import pytest
+from loguru import logger
+
+from packages.logging import python_logger
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("NODE_ENV", "production")
+    monkeypatch.setattr(python_logger, "_initialized", False)
+    monkeypatch.setattr(python_logger, "_LOGGER_CACHE", {})
+    yield tmp_path
+    logger.remove()
+
+
+def _lines(path):
+    logger.remove()  # closes the sinks, flushing queued and buffered records
+    return [orjson.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_file_sink_receives_unbound_records(log_dir):
+    python_logger.create_logger("svc-a").info("bound")
+    python_logger.create_logger("svc-b").info("other service")
+    logger.info("unbound")
+
+    messages = [entry["message"] for entry in _lines(log_dir / "svc-a.log")]
+    assert messages == ["bound", "unbound"]